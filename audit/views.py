@@ -13,6 +13,7 @@ from items.models import Item, ItemCategory
 from transfers.models import TransferRequest, TransferLog
 from locations.models import Location, Room
 from users.models import User
+from notifications.models import Notification
 from notifications.utils import create_notification, send_notification_email
 from django.views.decorators.http import require_POST
 from django.http import JsonResponse
@@ -113,7 +114,7 @@ def audit_mark_damaged(request, item_id):
     Mark item as damaged and auto-create return request to staff.
     This triggers the return workflow for inspection by staff.
     """
-    item = get_object_or_404(Item, pk=item_id)
+    item = get_object_or_404(Item.objects.select_related('current_owner'), pk=item_id)
 
     # Check if user has permission to audit this item
     if not request.user.can_audit_item(item):
@@ -155,7 +156,7 @@ def audit_mark_damaged(request, item_id):
                 # Notify current owner
                 create_notification(
                     recipient=item.current_owner,
-                    notification_type='ITEM_DAMAGED',
+                    notification_type=Notification.NotificationType.ITEM_DAMAGED,
                     title=f'Audit: Item {item.asset_id} Marked as Damaged',
                     message=f'Auditor has identified your item "{item.name}" as damaged. A return request has been created for inspection.',
                     related_request=transfer_request,
@@ -195,7 +196,7 @@ def audit_mark_lost(request, item_id):
     Mark item as LOST.
     Item remains assigned to current owner (keeps them accountable).
     """
-    item = get_object_or_404(Item, pk=item_id)
+    item = get_object_or_404(Item.objects.select_related('current_owner'), pk=item_id)
 
     # Check if user has permission to audit this item
     if not request.user.can_audit_item(item):
@@ -226,7 +227,7 @@ def audit_mark_lost(request, item_id):
             # Notify current owner
             create_notification(
                 recipient=item.current_owner,
-                notification_type='ITEM_LOST',
+                notification_type=Notification.NotificationType.ITEM_LOST,
                 title=f'Audit: Item {item.asset_id} Marked as Lost',
                 message=f'Auditor has marked your item "{item.name}" as LOST. You are still responsible for this item until it is found or written off.',
                 related_item=item
@@ -289,7 +290,7 @@ def audit_found_item(request, item_id):
     Recovery workflow for found lost items.
     Requires condition assessment before returning to system.
     """
-    item = get_object_or_404(Item, pk=item_id)
+    item = get_object_or_404(Item.objects.select_related('current_owner'), pk=item_id)
 
     # Check if user has permission to audit this item
     if not request.user.can_audit_item(item):
@@ -323,7 +324,7 @@ def audit_found_item(request, item_id):
                 # Notify old owner that item was found
                 create_notification(
                     recipient=old_owner,
-                    notification_type='ITEM_FOUND',
+                    notification_type=Notification.NotificationType.ITEM_FOUND,
                     title=f'Item {item.asset_id} Found',
                     message=f'Good news! Your lost item "{item.name}" has been found and assessed as {item.get_status_display()}.',
                     related_item=item
@@ -363,7 +364,7 @@ def update_item_status(request, pk):
     AJAX view to update item status from audit checklist.
     Allows quick status updates for audits.
     """
-    item = get_object_or_404(Item, pk=pk)
+    item = get_object_or_404(Item.objects.select_related('current_owner'), pk=pk)
 
     # Check if user has permission to audit this item
     if not request.user.can_audit_item(item):
@@ -453,7 +454,7 @@ def audit_report(request):
     # Recent transfers
     recent_transfers = TransferLog.objects.filter(
         transferred_at__gte=start_date
-    ).select_related('item', 'from_user', 'to_user').order_by('-transferred_at')[:30]
+    ).with_related().order_by('-transferred_at')[:30]
 
     # Items needing attention (damaged, lost, repair, pending inspection)
     items_needing_attention = Item.objects.filter(
@@ -63,7 +63,6 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [BASE_DIR / 'templates'],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.debug',
@@ -72,6 +71,14 @@ TEMPLATES = [
                 'django.contrib.messages.context_processors.messages',
                 'notifications.context_processors.unread_notifications',
             ],
+            # Cache compiled templates in-process (notification emails are
+            # rendered repeatedly by the expiration jobs)
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
         },
     },
 ]
@@ -243,6 +250,29 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers:DatabaseScheduler'
+# Run tasks in-process (e.g. local development without a Redis broker)
+CELERY_TASK_ALWAYS_EAGER = config('CELERY_TASK_ALWAYS_EAGER', default=False, cast=bool)
+# Web requests queue notification tasks after commit; when the broker is
+# down, give up after one reconnect attempt (~2s) instead of kombu's default
+# backoff, and let queue_notification() send the notification in-process
+CELERY_BROKER_TRANSPORT_OPTIONS = {'max_retries': 1}
+
+# Cache (short-lived page statistics). Shared Redis cache when configured so
+# invalidation reaches every worker; per-process memory cache otherwise
+CACHE_URL = config('CACHE_URL', default='')
+if CACHE_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
 
 # Site URL for email links
 SITE_URL = config('SITE_URL', default='http://localhost:8000')
@@ -316,5 +346,9 @@ LOGGING = {
             'handlers': ['file'],
             'level': 'INFO',
         },
+        'notifications': {
+            'handlers': ['file', 'console'],
+            'level': 'INFO',
+        },
     },
 }
@@ -75,7 +75,7 @@ def staff_dashboard(request):
     # Get pending transfer requests
     pending_requests = TransferRequest.objects.filter(
         status='PENDING'
-    ).select_related('item', 'from_user', 'to_user')
+    ).with_related()
 
     # Get requests I need to handle (sent to me)
     my_pending_requests = pending_requests.filter(to_user=user)
@@ -83,7 +83,7 @@ def staff_dashboard(request):
     # Get recent transfers
     recent_transfers = TransferRequest.objects.filter(
         status='ACCEPTED'
-    ).select_related('item', 'from_user', 'to_user').order_by('-resolved_at')[:10]
+    ).with_related().order_by('-resolved_at')[:10]
 
     context = {
         'total_items': all_items.count(),
@@ -137,7 +137,7 @@ def manager_dashboard(request):
     # Recent activity
     recent_transfers = TransferRequest.objects.filter(
         status='ACCEPTED'
-    ).select_related('item', 'from_user', 'to_user').order_by('-resolved_at')[:15]
+    ).with_related().order_by('-resolved_at')[:15]
 
     context = {
         'total_items': total_items,
@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Count
 from django.utils.html import format_html
 from .models import Item, ItemCategory
 
@@ -11,11 +12,15 @@ class ItemCategoryAdmin(admin.ModelAdmin):
     search_fields = ['name', 'description']
     ordering = ['name']
 
+    def get_queryset(self, request):
+        """Count items in the changelist query instead of once per row."""
+        return super().get_queryset(request).annotate(items_total=Count('items'))
+
     def item_count(self, obj):
         """Display count of items in category."""
-        count = obj.items.count()
-        return count
+        return obj.items_total
     item_count.short_description = 'Items'
+    item_count.admin_order_field = 'items_total'
 
 
 @admin.register(Item)
@@ -39,6 +39,10 @@ class Item(models.Model):
         PENDING_INSPECTION = 'PENDING_INSPECTION', 'Pending Inspection'
         REMOVED = 'REMOVED', 'Removed from System'
 
+    # Precomputed label lookup; get_status_display() rebuilds the choices
+    # dict on every call, which adds up on long item lists
+    _STATUS_LABELS = dict(Status.choices)
+
     # Basic Information
     name = models.CharField(max_length=200, verbose_name='Item Name')
     model = models.CharField(
@@ -179,6 +183,11 @@ class Item(models.Model):
             self.Status.PENDING_INSPECTION
         ]
 
+    @property
+    def status_label(self):
+        """Display label of status (dict lookup, for per-row list templates)."""
+        return self._STATUS_LABELS.get(self.status, self.status)
+
     @property
     def is_inactive(self):
         """Check if item is inactive (cannot be transferred)."""
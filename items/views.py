@@ -5,6 +5,7 @@ Item management views.
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
 from django.db.models import Q
+from django.utils import timezone
 
 from users.decorators import staff_required, owns_item_or_staff, member_or_staff_required
 from .models import Item, ItemCategory
@@ -161,18 +162,19 @@ def item_delete(request, pk):
             # Get transfer history count before deleting
             transfer_count = item.transfer_logs.count()
 
-            # Hard delete: Permanently remove from database
+            # Hard delete: Permanently remove from database. Transfer logs
+            # are kept (their item link is set to NULL)
             item.delete()
 
             messages.success(
                 request,
                 f"Item {asset_id} - {name} has been permanently deleted from the database. "
-                f"{transfer_count} transfer log(s) were also removed."
+                f"{transfer_count} transfer log(s) were kept in the audit trail."
             )
         else:
-            # Soft delete: Mark as REMOVED instead of deleting
-            item.status = 'REMOVED'
-            item.save()
+            # Soft delete: Mark as REMOVED instead of deleting (status-only
+            # UPDATE; no ownership change for Item.clean() to validate)
+            Item.objects.filter(pk=item.pk).update(status='REMOVED', updated_at=timezone.now())
 
             messages.success(
                 request,
@@ -205,8 +207,11 @@ def update_item_location(request, pk):
     if request.method == 'POST':
         form = UpdateLocationForm(request.POST)
         if form.is_valid():
-            item.current_location = form.cleaned_data['current_location']
-            item.save()
+            # Location-only UPDATE (the form already validated the room)
+            Item.objects.filter(pk=item.pk).update(
+                current_location=form.cleaned_data['current_location'],
+                updated_at=timezone.now()
+            )
             messages.success(
                 request,
                 f"Location updated for {item.asset_id} - {item.name}."
@@ -275,7 +280,6 @@ def bulk_delete_items(request):
         # Check if this is the confirmation step
         if 'confirm' in request.POST:
             from django.db import transaction
-            from django.utils import timezone
 
             with transaction.atomic():
                 # Lock rows for update to prevent race conditions
@@ -317,7 +321,6 @@ def bulk_update_status(request):
         # Check if this is the confirmation step with new status
         if 'new_status' in request.POST:
             from django.db import transaction
-            from django.utils import timezone
 
             new_status = request.POST.get('new_status')
 
@@ -390,23 +393,25 @@ def bulk_transfer_items(request):
             with transaction.atomic():
                 # Lock items for update to prevent race conditions
                 items = Item.objects.filter(pk__in=item_ids).select_for_update()
-                count = 0
+                log_rows = []
 
-                # Transfer each item and create transfer log
+                # Transfer each item and collect its transfer log
                 for item in items:
-                    old_owner = item.current_owner
+                    old_owner_id = item.current_owner_id
                     item.current_owner = new_owner
                     item.save()
 
-                    # Create transfer log
-                    TransferLog.objects.create(
-                        item=item,
-                        from_user=old_owner,
-                        to_user=new_owner,
-                        is_forced=True,
-                        notes=notes or f"Bulk transfer by {request.user.email}"
-                    )
-                    count += 1
+                    log_rows.append({
+                        'item': item,
+                        'from_user_id': old_owner_id,
+                        'to_user': new_owner,
+                        'is_forced': True,
+                        'notes': notes or f"Bulk transfer by {request.user.email}",
+                    })
+
+                # Create all transfer logs in batched INSERTs
+                TransferLog.bulk_log(log_rows)
+                count = len(log_rows)
 
             messages.success(
                 request,
@@ -492,7 +497,6 @@ def bulk_restore_items(request):
         # Check if this is the confirmation step with new status
         if 'new_status' in request.POST:
             from django.db import transaction
-            from django.utils import timezone
 
             new_status = request.POST.get('new_status')
 
@@ -0,0 +1,48 @@
+# Generated migration to add trigram indexes for room search (PostgreSQL only)
+
+from django.db import migrations
+
+
+# room_list searches with code__icontains / description__icontains, which
+# PostgreSQL compiles to UPPER(col::text) LIKE UPPER('%term%'). A pg_trgm GIN
+# index on the same expression lets those substring searches use an index.
+TRIGRAM_INDEXES = [
+    ('locations_room_code_trgm_idx', 'code'),
+    ('locations_room_description_trgm_idx', 'description'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """Enable pg_trgm and index the room search columns."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON locations_room '
+            f'USING gin (UPPER({column}::text) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    """Reverse migration: drop the trigram indexes (the extension is left installed)."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for name, _ in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('locations', '0002_room'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_trigram_indexes,
+            reverse_code=drop_trigram_indexes
+        ),
+    ]
@@ -36,6 +36,8 @@ class Room(models.Model):
             models.Index(fields=['code']),
             models.Index(fields=['is_active']),
         ]
+        # Trigram indexes for code/description search are created on
+        # PostgreSQL by migration 0003_room_trigram_indexes.
 
     def __str__(self):
         return self.code
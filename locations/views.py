@@ -4,6 +4,7 @@ Location and room management views.
 
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
+from django.core.paginator import Paginator
 from django.db.models import Q, Count
 from users.decorators import manager_required
 from .models import Room, Location
@@ -31,8 +32,13 @@ def room_list(request):
     # Annotate with item count
     rooms = rooms.annotate(item_count=Count('items')).order_by('code')
 
+    # Paginate so only one page of rooms is aggregated per request
+    paginator = Paginator(rooms, 50)
+    page_obj = paginator.get_page(request.GET.get('page'))
+
     context = {
-        'rooms': rooms,
+        'rooms': page_obj,
+        'page_obj': page_obj,
         'search_query': search_query,
         'total_rooms': total_rooms,
         'active_rooms': active_rooms,
@@ -2,6 +2,9 @@
 Context processors for notifications.
 """
 
+from django.db.models import Prefetch
+
+from transfers.models import TransferRequest
 from .models import Notification
 
 
@@ -10,14 +13,24 @@ def unread_notifications(request):
     Add unread notification count to template context.
     """
     if request.user.is_authenticated:
-        unread_count = Notification.objects.filter(
-            recipient=request.user,
-            is_read=False
-        ).count()
+        # Maintained on the user row, so no COUNT query per page render
+        unread_count = request.user.unread_notification_count
 
+        # Narrow base fetch; the related request is prefetched separately so
+        # only notifications that have one pay for the item lookup
         recent_notifications = Notification.objects.filter(
             recipient=request.user
-        ).select_related('related_request__item').order_by('-created_at')[:5]
+        ).only(
+            'id', 'title', 'message', 'notification_type', 'is_read',
+            'created_at', 'related_request_id'
+        ).prefetch_related(
+            Prefetch(
+                'related_request',
+                queryset=TransferRequest.objects.select_related('item').only(
+                    'id', 'item__asset_id', 'item__name'
+                )
+            )
+        ).order_by('-created_at')[:5]
     else:
         unread_count = 0
         recent_notifications = []
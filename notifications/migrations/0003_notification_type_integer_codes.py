@@ -0,0 +1,79 @@
+# Generated migration to store notification_type as a small integer code
+
+from django.db import migrations, models
+from django.db.models import Case, Value, When
+
+
+# Frozen copy of Notification.NotificationType - must not follow later edits
+TYPE_CODES = {
+    'NEW_REQUEST': 1,
+    'REQUEST_ACCEPTED': 2,
+    'REQUEST_REJECTED': 3,
+    'REQUEST_EXPIRING_SOON': 4,
+    'REQUEST_EXPIRED': 5,
+    'ITEM_DAMAGED': 6,
+    'ITEM_LOST': 7,
+    'ITEM_FOUND': 8,
+    'REQUEST_UPDATED': 9,
+    'REQUEST_EXTENDED': 10,
+}
+
+
+def text_to_code(apps, schema_editor):
+    """Translate the old text values into integer codes with one CASE UPDATE."""
+    Notification = apps.get_model('notifications', 'Notification')
+    Notification.objects.update(
+        notification_type_code=Case(
+            *[When(notification_type=name, then=Value(code)) for name, code in TYPE_CODES.items()],
+            # Unknown legacy values fall back to a generic request update
+            default=Value(TYPE_CODES['REQUEST_UPDATED']),
+        )
+    )
+
+
+def code_to_text(apps, schema_editor):
+    """Translate integer codes back into the old text values."""
+    Notification = apps.get_model('notifications', 'Notification')
+    Notification.objects.update(
+        notification_type=Case(
+            *[When(notification_type_code=code, then=Value(name)) for name, code in TYPE_CODES.items()],
+            default=Value('REQUEST_UPDATED'),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_notification_updated_at_alter_notification_recipient_and_more'),
+    ]
+
+    operations = [
+        # Add the integer column, copy values across, then swap it in
+        migrations.AddField(
+            model_name='notification',
+            name='notification_type_code',
+            field=models.PositiveSmallIntegerField(null=True),
+        ),
+        # Relax the old column so the reverse path can re-add it before refilling
+        migrations.AlterField(
+            model_name='notification',
+            name='notification_type',
+            field=models.CharField(max_length=30, null=True, verbose_name='Type'),
+        ),
+        migrations.RunPython(text_to_code, reverse_code=code_to_text),
+        migrations.RemoveField(
+            model_name='notification',
+            name='notification_type',
+        ),
+        migrations.RenameField(
+            model_name='notification',
+            old_name='notification_type_code',
+            new_name='notification_type',
+        ),
+        migrations.AlterField(
+            model_name='notification',
+            name='notification_type',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'New Transfer Request'), (2, 'Request Accepted'), (3, 'Request Rejected'), (4, 'Request Expiring Soon'), (5, 'Request Expired'), (6, 'Item Marked as Damaged'), (7, 'Item Marked as Lost'), (8, 'Lost Item Found'), (9, 'Request Updated'), (10, 'Request Extended')], verbose_name='Type'),
+        ),
+    ]
@@ -1,5 +1,42 @@
-from django.db import models
+from collections import Counter, defaultdict
+
+from django.db import models, transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
 from django.conf import settings
+from django.contrib.auth import get_user_model
+
+
+def _adjust_unread_counts(deltas):
+    """
+    Apply {recipient_id: delta} to the recipients' unread counters.
+
+    One UPDATE per distinct delta; the counter is clamped at zero so an
+    already-drifted value can't underflow the unsigned column.
+    """
+    recipients_by_delta = defaultdict(list)
+    for recipient_id, delta in deltas.items():
+        if recipient_id and delta:
+            recipients_by_delta[delta].append(recipient_id)
+    for delta, recipient_ids in recipients_by_delta.items():
+        get_user_model().objects.filter(pk__in=recipient_ids).update(
+            unread_notification_count=Greatest(F('unread_notification_count') + delta, 0)
+        )
+
+
+class NotificationQuerySet(models.QuerySet):
+    """QuerySet helpers for notifications."""
+
+    @transaction.atomic
+    def delete(self):
+        """Delete the notifications and drop the unread ones from their recipients' counters."""
+        unread = Counter(dict(
+            self.filter(is_read=False, recipient__isnull=False)
+            .order_by().values_list('recipient').annotate(n=models.Count('pk'))
+        ))
+        result = super().delete()
+        _adjust_unread_counts({recipient_id: -n for recipient_id, n in unread.items()})
+        return result
 
 
 class Notification(models.Model):
@@ -8,15 +45,18 @@ class Notification(models.Model):
     Tracks notification events like new requests, expiring requests, etc.
     """
 
-    class NotificationType(models.TextChoices):
-        NEW_REQUEST = 'NEW_REQUEST', 'New Transfer Request'
-        REQUEST_ACCEPTED = 'REQUEST_ACCEPTED', 'Request Accepted'
-        REQUEST_REJECTED = 'REQUEST_REJECTED', 'Request Rejected'
-        REQUEST_EXPIRING_SOON = 'REQUEST_EXPIRING_SOON', 'Request Expiring Soon'
-        REQUEST_EXPIRED = 'REQUEST_EXPIRED', 'Request Expired'
-        ITEM_DAMAGED = 'ITEM_DAMAGED', 'Item Marked as Damaged'
-        ITEM_LOST = 'ITEM_LOST', 'Item Marked as Lost'
-        ITEM_FOUND = 'ITEM_FOUND', 'Lost Item Found'
+    class NotificationType(models.IntegerChoices):
+        # Stored as small integer codes - never renumber existing members
+        NEW_REQUEST = 1, 'New Transfer Request'
+        REQUEST_ACCEPTED = 2, 'Request Accepted'
+        REQUEST_REJECTED = 3, 'Request Rejected'
+        REQUEST_EXPIRING_SOON = 4, 'Request Expiring Soon'
+        REQUEST_EXPIRED = 5, 'Request Expired'
+        ITEM_DAMAGED = 6, 'Item Marked as Damaged'
+        ITEM_LOST = 7, 'Item Marked as Lost'
+        ITEM_FOUND = 8, 'Lost Item Found'
+        REQUEST_UPDATED = 9, 'Request Updated'
+        REQUEST_EXTENDED = 10, 'Request Extended'
 
     recipient = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -25,8 +65,7 @@ class Notification(models.Model):
         related_name='notifications',
         verbose_name='Recipient'
     )
-    notification_type = models.CharField(
-        max_length=30,
+    notification_type = models.PositiveSmallIntegerField(
         choices=NotificationType.choices,
         verbose_name='Type'
     )
@@ -60,6 +99,8 @@ class Notification(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = NotificationQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'Notification'
         verbose_name_plural = 'Notifications'
@@ -71,6 +112,44 @@ class Notification(models.Model):
     def __str__(self):
         return f"{self.get_notification_type_display()} for {self.recipient.email}"
 
+    @property
+    def notification_type_name(self):
+        """Symbolic name of the notification type (e.g. 'NEW_REQUEST')."""
+        return self.NotificationType(self.notification_type).name
+
+    @transaction.atomic
+    def save(self, *args, **kwargs):
+        """
+        Keep the recipient's denormalized unread count in step with this row.
+
+        New unread notifications add one. On updates that touch is_read or
+        recipient (e.g. from the admin), the stored values are compared so
+        the old recipient loses and the new one gains an unread.
+        """
+        deltas = Counter()
+        update_fields = kwargs.get('update_fields')
+        if self._state.adding:
+            deltas[self.recipient_id] += not self.is_read
+        elif update_fields is None or {'is_read', 'recipient', 'recipient_id'} & set(update_fields):
+            stored = Notification.objects.select_for_update().filter(pk=self.pk).values_list(
+                'recipient_id', 'is_read'
+            ).first()
+            if stored:
+                stored_recipient_id, stored_is_read = stored
+                deltas[stored_recipient_id] -= not stored_is_read
+                deltas[self.recipient_id] += not self.is_read
+
+        super().save(*args, **kwargs)
+        _adjust_unread_counts(deltas)
+
+    @transaction.atomic
+    def delete(self, *args, **kwargs):
+        """Delete the notification, dropping it from the unread count if it was unread."""
+        result = super().delete(*args, **kwargs)
+        if not self.is_read:
+            _adjust_unread_counts({self.recipient_id: -1})
+        return result
+
     def mark_as_read(self):
         """Mark notification as read."""
         if not self.is_read:
@@ -0,0 +1,104 @@
+"""
+Celery tasks for notifications app.
+
+Views queue these with transaction.on_commit() via queue_notification() so
+creating the in-app notification and sending the email happen on a worker,
+outside the request/response cycle. Tasks receive ids (JSON-serializable)
+and refetch the request with its relations.
+"""
+
+from celery import shared_task
+import logging
+
+from transfers.models import TransferRequest
+from users.models import User
+from .utils import (
+    notify_new_request, notify_request_accepted, notify_request_rejected,
+    notify_request_cancelled, notify_request_updated, notify_request_extended
+)
+
+logger = logging.getLogger(__name__)
+
+
+def queue_notification(task, *args):
+    """
+    Queue a notification task, falling back to running it in-process.
+
+    Called from transaction.on_commit(), i.e. after the request's changes
+    are committed, so a broker/result-backend outage must not turn the
+    response into a 500: the error is logged and the notification is sent
+    synchronously instead.
+    """
+    try:
+        task.apply_async(args, retry=False)
+    except Exception:
+        logger.exception("Could not queue %s; sending the notification in-process", task.name)
+        task(*args)
+
+
+def _get_transfer_request(request_id):
+    """Fetch a transfer request with the relations the notify_* helpers read."""
+    transfer_request = TransferRequest.objects.with_related().filter(pk=request_id).first()
+    if transfer_request is None:
+        logger.warning("Transfer request %s no longer exists, skipping notification", request_id)
+    return transfer_request
+
+
+def _get_request_and_actor(request_id, user_id):
+    """Fetch the transfer request and the user who acted on it, or (None, None)."""
+    transfer_request = _get_transfer_request(request_id)
+    if transfer_request is None:
+        return None, None
+    actor = User.objects.filter(pk=user_id).first()
+    if actor is None:
+        logger.warning("User %s no longer exists, skipping notification", user_id)
+        return None, None
+    return transfer_request, actor
+
+
+@shared_task(ignore_result=True)
+def send_new_request_notification(request_id):
+    """Notify the recipient of a new transfer request."""
+    transfer_request = _get_transfer_request(request_id)
+    if transfer_request:
+        notify_new_request(transfer_request)
+
+
+@shared_task(ignore_result=True)
+def send_request_accepted_notification(request_id):
+    """Notify the requester that their request was accepted."""
+    transfer_request = _get_transfer_request(request_id)
+    if transfer_request:
+        notify_request_accepted(transfer_request)
+
+
+@shared_task(ignore_result=True)
+def send_request_rejected_notification(request_id, reason):
+    """Notify the requester that their request was rejected."""
+    transfer_request = _get_transfer_request(request_id)
+    if transfer_request:
+        notify_request_rejected(transfer_request, reason)
+
+
+@shared_task(ignore_result=True)
+def send_request_cancelled_notification(request_id, user_id, reason=''):
+    """Notify the other party that a request was cancelled."""
+    transfer_request, actor = _get_request_and_actor(request_id, user_id)
+    if transfer_request:
+        notify_request_cancelled(transfer_request, actor, reason)
+
+
+@shared_task(ignore_result=True)
+def send_request_updated_notification(request_id, user_id):
+    """Notify the recipient that a request was edited."""
+    transfer_request, actor = _get_request_and_actor(request_id, user_id)
+    if transfer_request:
+        notify_request_updated(transfer_request, actor)
+
+
+@shared_task(ignore_result=True)
+def send_request_extended_notification(request_id, user_id, days, notes=''):
+    """Notify the other party that a request's deadline was extended."""
+    transfer_request, actor = _get_request_and_actor(request_id, user_id)
+    if transfer_request:
+        notify_request_extended(transfer_request, actor, days, notes)
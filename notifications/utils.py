@@ -2,10 +2,40 @@
 Notification helper functions.
 """
 
-from django.core.mail import send_mail
+import logging
+from collections import Counter
+
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
 from django.template.loader import render_to_string
 from django.conf import settings
-from .models import Notification
+from .models import Notification, _adjust_unread_counts
+
+logger = logging.getLogger(__name__)
+
+
+# Relations every notify_* helper reads when building titles and emails
+_NOTIFY_RELATIONS = ('item', 'from_user', 'to_user')
+
+
+def _ensure_related(transfer_request):
+    """
+    Make sure the relations used by the notify_* helpers are loaded.
+
+    Callers should pass a request fetched with
+    select_related('item', 'from_user', 'to_user'); anything missing is
+    loaded here in one query instead of one lazy query per attribute.
+    The caller's instance is kept (only its relation cache is filled) so
+    unsaved in-memory state is not replaced by a fresh database row.
+    """
+    fields_cache = transfer_request._state.fields_cache
+    missing = [name for name in _NOTIFY_RELATIONS if name not in fields_cache]
+    if missing and transfer_request.pk:
+        from transfers.models import TransferRequest
+        fetched = TransferRequest.objects.select_related(*missing).get(pk=transfer_request.pk)
+        for name in missing:
+            setattr(transfer_request, name, getattr(fetched, name))
+    return transfer_request
 
 
 def create_notification(recipient, notification_type, title, message, related_request=None, related_item=None):
@@ -34,9 +64,39 @@ def create_notification(recipient, notification_type, title, message, related_re
     return notification
 
 
-def send_notification_email(recipient, subject, template_name, context):
+@transaction.atomic
+def create_notifications(notifications):
     """
-    Send an email notification to a user.
+    Insert many notifications at once.
+
+    Batch counterpart of create_notification() for bulk operations:
+    bulk_create() skips Notification.save(), so the recipients' unread
+    counters are bumped here, with one UPDATE per distinct increment.
+
+    Args:
+        notifications: Unsaved Notification objects
+
+    Returns:
+        list: The created Notification objects
+    """
+    created = Notification.objects.bulk_create(notifications, batch_size=500)
+
+    _adjust_unread_counts(Counter(n.recipient_id for n in created if not n.is_read))
+
+    return created
+
+
+def _add_notification(notifications, **fields):
+    """Create a notification now, or queue it on `notifications` for create_notifications()."""
+    if notifications is None:
+        create_notification(**fields)
+    else:
+        notifications.append(Notification(**fields))
+
+
+def build_notification_email(recipient, subject, template_name, context):
+    """
+    Build an HTML email notification without sending it.
 
     Args:
         recipient: User to receive the email
@@ -45,7 +105,7 @@ def send_notification_email(recipient, subject, template_name, context):
         context: Dictionary of template context variables
 
     Returns:
-        Number of emails sent (0 or 1)
+        EmailMultiAlternatives object
     """
     # Add base URL to context for email links
     context['site_url'] = getattr(settings, 'SITE_URL', 'http://localhost:8000')
@@ -53,19 +113,61 @@ def send_notification_email(recipient, subject, template_name, context):
     # Render HTML email
     html_message = render_to_string(f'notifications/emails/{template_name}', context)
 
+    message = EmailMultiAlternatives(
+        subject=subject,
+        body='',  # Plain text version (empty, using HTML)
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[recipient.email],
+    )
+    message.attach_alternative(html_message, 'text/html')
+    return message
+
+
+def send_notification_email(recipient, subject, template_name, context):
+    """
+    Send an email notification to a user.
+
+    Args:
+        recipient: User to receive the email
+        subject: Email subject
+        template_name: Template file name (e.g., 'new_request.html')
+        context: Dictionary of template context variables
+
+    Returns:
+        Number of emails sent (0 or 1)
+    """
+    message = build_notification_email(recipient, subject, template_name, context)
+
     # Send email
     try:
-        send_mail(
-            subject=subject,
-            message='',  # Plain text version (empty, using HTML)
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[recipient.email],
-            html_message=html_message,
-            fail_silently=False,
+        return message.send(fail_silently=False)
+    except Exception:
+        logger.exception("Error sending email to %s", recipient.email)
+        return 0
+
+
+def send_bulk_notification_emails(messages):
+    """
+    Send several prepared email messages over a single SMTP connection.
+
+    Args:
+        messages: List of EmailMessage objects (see build_notification_email)
+
+    Returns:
+        Number of emails sent
+    """
+    if not messages:
+        return 0
+
+    try:
+        connection = get_connection(fail_silently=False)
+        return connection.send_messages(messages) or 0
+    except Exception:
+        logger.exception(
+            "Error sending %d emails to %s",
+            len(messages),
+            ', '.join(address for message in messages for address in message.to)
         )
-        return 1
-    except Exception as e:
-        print(f"Error sending email to {recipient.email}: {e}")
         return 0
 
 
@@ -74,6 +176,8 @@ def notify_new_request(transfer_request):
     Notify user about a new transfer request.
     Creates both in-app notification and sends email.
     """
+    _ensure_related(transfer_request)
+
     recipient = transfer_request.to_user
     request_type = transfer_request.get_request_type_display()
 
@@ -101,6 +205,8 @@ def notify_new_request(transfer_request):
 
 def notify_request_accepted(transfer_request):
     """Notify user that their request was accepted."""
+    _ensure_related(transfer_request)
+
     recipient = transfer_request.from_user
 
     title = "Request Accepted"
@@ -125,6 +231,8 @@ def notify_request_accepted(transfer_request):
 
 def notify_request_rejected(transfer_request, reason):
     """Notify user that their request was rejected."""
+    _ensure_related(transfer_request)
+
     recipient = transfer_request.from_user
 
     title = "Request Rejected"
@@ -148,21 +256,79 @@ def notify_request_rejected(transfer_request, reason):
     send_notification_email(recipient, subject, 'request_rejected.html', context)
 
 
-def notify_request_expiring_soon(transfer_request, hours_remaining):
+def _actor_name(user):
+    """Display name used when a notification says who did something."""
+    return user.get_full_name() or user.email
+
+
+def _other_party(transfer_request, user):
+    """The side of the request that `user` isn't on."""
+    if transfer_request.from_user_id == user.pk:
+        return transfer_request.to_user
+    return transfer_request.from_user
+
+
+def notify_request_cancelled(transfer_request, cancelled_by, reason=''):
+    """Notify the other party that a pending request was cancelled (in-app only)."""
+    _ensure_related(transfer_request)
+
+    create_notification(
+        recipient=_other_party(transfer_request, cancelled_by),
+        notification_type=Notification.NotificationType.REQUEST_EXPIRED,  # Reuse EXPIRED type for cancelled
+        title='Transfer Request Cancelled',
+        message=f'{_actor_name(cancelled_by)} cancelled a transfer request for {transfer_request.item.name}. {reason if reason else ""}',
+        related_request=transfer_request
+    )
+
+
+def notify_request_updated(transfer_request, updated_by):
+    """Notify the recipient that the sender edited a pending request (in-app only)."""
+    _ensure_related(transfer_request)
+
+    create_notification(
+        recipient=transfer_request.to_user,
+        notification_type=Notification.NotificationType.REQUEST_UPDATED,
+        title='Transfer Request Updated',
+        message=f'{_actor_name(updated_by)} updated a transfer request for {transfer_request.item.name}.',
+        related_request=transfer_request
+    )
+
+
+def notify_request_extended(transfer_request, extended_by, days, notes=''):
+    """Notify the other party that a request's deadline was extended (in-app only)."""
+    _ensure_related(transfer_request)
+
+    create_notification(
+        recipient=_other_party(transfer_request, extended_by),
+        notification_type=Notification.NotificationType.REQUEST_EXTENDED,
+        title='Transfer Request Deadline Extended',
+        message=f'{_actor_name(extended_by)} extended the deadline for {transfer_request.item.name} by {days} days. {notes if notes else ""}',
+        related_request=transfer_request
+    )
+
+
+def notify_request_expiring_soon(transfer_request, hours_remaining, emails=None, notifications=None):
     """
     Notify user that their pending request is expiring soon.
 
     Args:
         transfer_request: TransferRequest object
         hours_remaining: Hours until expiration (48 or 24)
+        emails: Optional list to collect the email into instead of sending it,
+                for batch callers that send with send_bulk_notification_emails()
+        notifications: Optional list to collect the in-app notification into,
+                       for batch callers that insert with create_notifications()
     """
+    _ensure_related(transfer_request)
+
     recipient = transfer_request.to_user
 
     title = f"Request Expiring in {hours_remaining} Hours"
     message = f"You have a pending request for {transfer_request.item.asset_id} that will expire in {hours_remaining} hours."
 
     # Always create in-app notification
-    create_notification(
+    _add_notification(
+        notifications,
         recipient=recipient,
         notification_type=Notification.NotificationType.REQUEST_EXPIRING_SOON,
         title=title,
@@ -178,23 +344,34 @@ def notify_request_expiring_soon(transfer_request, hours_remaining):
             'transfer_request': transfer_request,
             'hours_remaining': hours_remaining,
         }
-        send_notification_email(recipient, subject, 'request_expiring_soon.html', context)
+        if emails is not None:
+            emails.append(build_notification_email(recipient, subject, 'request_expiring_soon.html', context))
+        else:
+            send_notification_email(recipient, subject, 'request_expiring_soon.html', context)
 
 
-def notify_request_expired(transfer_request):
+def notify_request_expired(transfer_request, emails=None, notifications=None):
     """
     Notify users that a request has expired.
 
     Always creates in-app notifications for both sender and recipient.
-    Sends email only if user hasn't opted out of expiration emails.
+    Sends email only if user hasn't opted out of expiration emails; both
+    emails share one SMTP connection. Pass a list as `emails` (and as
+    `notifications` for the in-app rows) to collect them for a larger
+    batch instead of sending/inserting here.
     """
+    _ensure_related(transfer_request)
+
+    batch = [] if emails is None else emails
+
     # Notify both sender and recipient
     for user in [transfer_request.from_user, transfer_request.to_user]:
         title = "Request Expired"
         message = f"Transfer request for {transfer_request.item.asset_id} has expired."
 
         # Always create in-app notification
-        create_notification(
+        _add_notification(
+            notifications,
             recipient=user,
             notification_type=Notification.NotificationType.REQUEST_EXPIRED,
             title=title,
@@ -209,7 +386,10 @@ def notify_request_expired(transfer_request):
                 'recipient': user,
                 'transfer_request': transfer_request,
             }
-            send_notification_email(user, subject, 'request_expired.html', context)
+            batch.append(build_notification_email(user, subject, 'request_expired.html', context))
+
+    if emails is None:
+        send_bulk_notification_emails(batch)
 
 
 def get_unread_count(user):
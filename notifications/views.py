@@ -2,10 +2,13 @@
 Notification views.
 """
 
-from django.shortcuts import render, redirect, get_object_or_404
+from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from django.views.decorators.http import require_POST
-from django.http import JsonResponse
+from django.http import JsonResponse, Http404
+from django.db import transaction
+from django.db.models import F
+from users.models import User
 from .models import Notification
 
 
@@ -39,8 +42,17 @@ def notification_list(request):
 @require_POST
 def mark_as_read(request, pk):
     """Mark a single notification as read."""
-    notification = get_object_or_404(Notification, pk=pk, recipient=request.user)
-    notification.mark_as_read()
+    # Single conditional UPDATE; only check existence when nothing changed
+    updated = Notification.objects.filter(
+        pk=pk, recipient=request.user, is_read=False
+    ).update(is_read=True)
+
+    if updated:
+        User.objects.filter(
+            pk=request.user.pk, unread_notification_count__gt=0
+        ).update(unread_notification_count=F('unread_notification_count') - 1)
+    elif not Notification.objects.filter(pk=pk, recipient=request.user).exists():
+        raise Http404("No Notification matches the given query.")
 
     # Redirect back to referrer or notification list
     return redirect(request.META.get('HTTP_REFERER', 'notifications:list'))
@@ -51,7 +63,10 @@ def mark_all_as_read(request):
     """Mark all notifications as read for current user."""
     # Only mark as read on POST requests (for security)
     if request.method == 'POST':
-        Notification.objects.filter(recipient=request.user, is_read=False).update(is_read=True)
+        # Both UPDATEs commit together so the counter never disagrees with the rows
+        with transaction.atomic():
+            Notification.objects.filter(recipient=request.user, is_read=False).update(is_read=True)
+            User.objects.filter(pk=request.user.pk).update(unread_notification_count=0)
 
     # Redirect back to referrer or notification list (works for both GET and POST)
     return redirect(request.META.get('HTTP_REFERER', 'notifications:list'))
@@ -60,5 +75,6 @@ def mark_all_as_read(request):
 @login_required
 def get_unread_count_ajax(request):
     """AJAX endpoint to get unread notification count."""
-    count = Notification.objects.filter(recipient=request.user, is_read=False).count()
-    return JsonResponse({'count': count})
+    # Served from the denormalized counter on the already-loaded user row,
+    # so polling costs no extra query (and needs no cache invalidation)
+    return JsonResponse({'count': request.user.unread_notification_count})
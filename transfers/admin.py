@@ -1,10 +1,34 @@
 from django.contrib import admin
 from django.utils.html import format_html
+from django.utils.safestring import mark_safe
 from django.utils import timezone
 from django.contrib import messages
+from django.db.models import DateTimeField, Value
+from django.db.models.functions import Coalesce
+from datetime import timedelta
 from .models import TransferRequest, TransferLog
 
 
+# Changelist cell templates, built once; only the label/number varies per row
+STATUS_BADGE_HTML = {
+    status: f'<span style="color: {color}; font-weight: bold;">{{}}</span>'
+    for status, color in {
+        'PENDING': 'orange',
+        'ACCEPTED': 'green',
+        'REJECTED': 'red',
+        'EXPIRED': 'gray',
+    }.items()
+}
+STATUS_BADGE_DEFAULT_HTML = '<span style="color: gray; font-weight: bold;">{}</span>'
+
+COUNTDOWN_EXPIRED_HTML = mark_safe(
+    '<span style="color: red; font-weight: bold;">EXPIRED</span>'
+)
+COUNTDOWN_CRITICAL_HTML = '<span style="color: red; font-weight: bold;">⚠️ {} hours</span>'
+COUNTDOWN_WARNING_HTML = '<span style="color: orange; font-weight: bold;">⚠️ {} hours</span>'
+COUNTDOWN_NORMAL_HTML = '<span style="color: green;">{} days</span>'
+
+
 @admin.register(TransferRequest)
 class TransferRequestAdmin(admin.ModelAdmin):
     """Admin for Transfer Requests with expiration management."""
@@ -13,12 +37,18 @@ class TransferRequestAdmin(admin.ModelAdmin):
         'item', 'request_type', 'from_user', 'to_user',
         'status_badge', 'expiration_countdown', 'created_at', 'resolved_at'
     ]
+    list_select_related = ['item', 'from_user', 'to_user']
     list_filter = [
         'status', 'request_type', 'created_at',
         'warning_48h_sent', 'warning_24h_sent'
     ]
-    search_fields = ['item__asset_id', 'from_user__email', 'to_user__email', 'notes']
+    # notes is free text with no index; searching it meant a LIKE scan of every row
+    search_fields = ['item__asset_id', 'from_user__email', 'to_user__email']
     ordering = ['-created_at']
+    # AJAX search widgets instead of <select>s listing every item/user
+    autocomplete_fields = ['item', 'from_user', 'to_user']
+    # Skip the unfiltered COUNT(*) shown next to filtered/search results
+    show_full_result_count = False
     readonly_fields = [
         'created_at', 'updated_at', 'resolved_at', 'original_item_status',
         'warning_48h_sent', 'warning_24h_sent', 'manually_expired_by'
@@ -53,144 +83,114 @@ class TransferRequestAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        """Join the relations rendered by __str__ and the read-only fields."""
+        # One clock reading per request, carried on the rows, for every
+        # countdown cell on the page (the admin instance itself is shared)
+        return super().get_queryset(request).select_related(
+            'item', 'from_user', 'to_user', 'manually_expired_by'
+        ).annotate(
+            countdown_now=Value(timezone.now(), output_field=DateTimeField())
+        )
+
     def status_badge(self, obj):
         """Display status with color coding."""
-        colors = {
-            'PENDING': 'orange',
-            'ACCEPTED': 'green',
-            'REJECTED': 'red',
-            'EXPIRED': 'gray',
-        }
-        color = colors.get(obj.status, 'gray')
         return format_html(
-            '<span style="color: {}; font-weight: bold;">{}</span>',
-            color,
+            STATUS_BADGE_HTML.get(obj.status, STATUS_BADGE_DEFAULT_HTML),
             obj.get_status_display()
         )
     status_badge.short_description = 'Status'
 
     def expiration_countdown(self, obj):
         """Display time until expiration with urgency indicator."""
-        if obj.status != TransferRequest.Status.PENDING:
+        # Plain column reads only; resolved rows (most of the list) stop here
+        deadline = obj.expiration_extended_until or obj.expires_at
+        if obj.status != TransferRequest.Status.PENDING or not deadline:
             return '-'
 
-        time_delta = obj.time_until_expiration()
-        if not time_delta:
-            return format_html(
-                '<span style="color: red; font-weight: bold;">EXPIRED</span>'
-            )
-
+        time_delta = deadline - (getattr(obj, 'countdown_now', None) or timezone.now())
         hours = time_delta.total_seconds() / 3600
-        days = time_delta.days
+        if hours <= 0:
+            return COUNTDOWN_EXPIRED_HTML
 
         if hours < 24:
             # Critical: less than 24 hours
-            return format_html(
-                '<span style="color: red; font-weight: bold;">⚠️ {} hours</span>',
-                int(hours)
-            )
+            return format_html(COUNTDOWN_CRITICAL_HTML, int(hours))
         elif hours < 48:
             # Warning: less than 48 hours
-            return format_html(
-                '<span style="color: orange; font-weight: bold;">⚠️ {} hours</span>',
-                int(hours)
-            )
+            return format_html(COUNTDOWN_WARNING_HTML, int(hours))
         else:
             # Normal: more than 48 hours
-            return format_html(
-                '<span style="color: green;">{} days</span>',
-                days
-            )
+            return format_html(COUNTDOWN_NORMAL_HTML, time_delta.days)
     expiration_countdown.short_description = 'Expires In'
 
-    def extend_expiration_3_days(self, request, queryset):
-        """Extend expiration deadline by 3 days for selected requests."""
-        if not request.user.is_manager and not request.user.is_superuser:
-            self.message_user(
-                request,
-                "Only managers can extend expiration deadlines.",
-                level=messages.ERROR
-            )
-            return
-
-        pending_requests = queryset.filter(status=TransferRequest.Status.PENDING)
-        count = 0
-
-        for req in pending_requests:
-            try:
-                req.extend_expiration(days=3, extended_by_user=request.user)
-                count += 1
-            except Exception as e:
-                self.message_user(
-                    request,
-                    f"Error extending request {req.pk}: {str(e)}",
-                    level=messages.ERROR
-                )
+    def has_manage_expiration_permission(self, request):
+        """Expiration actions are limited to managers (and superusers)."""
+        user = request.user
+        return user.is_superuser or user.is_manager
+
+    def _extend_pending(self, request, queryset, days):
+        """Push the deadline of every selected pending request back by `days`."""
+        # One UPDATE for the whole selection: the new deadline is computed
+        # from the current one (original or already extended) in SQL.
+        # Warning flags are reset so warnings can be sent again.
+        now = timezone.now()
+        count = queryset.filter(
+            status=TransferRequest.Status.PENDING,
+            expires_at__isnull=False
+        ).update(
+            expiration_extended_until=Coalesce(
+                'expiration_extended_until', 'expires_at'
+            ) + timedelta(days=days),
+            warning_48h_sent=False,
+            warning_24h_sent=False,
+            updated_at=now
+        )
 
         self.message_user(
             request,
-            f"Successfully extended {count} request(s) by 3 days.",
+            f"Successfully extended {count} request(s) by {days} days.",
             level=messages.SUCCESS
         )
+
+    def extend_expiration_3_days(self, request, queryset):
+        """Extend expiration deadline by 3 days for selected requests."""
+        self._extend_pending(request, queryset, days=3)
     extend_expiration_3_days.short_description = "Extend expiration by 3 days"
+    extend_expiration_3_days.allowed_permissions = ('manage_expiration',)
 
     def extend_expiration_7_days(self, request, queryset):
         """Extend expiration deadline by 7 days for selected requests."""
-        if not request.user.is_manager and not request.user.is_superuser:
-            self.message_user(
-                request,
-                "Only managers can extend expiration deadlines.",
-                level=messages.ERROR
-            )
-            return
-
-        pending_requests = queryset.filter(status=TransferRequest.Status.PENDING)
-        count = 0
-
-        for req in pending_requests:
-            try:
-                req.extend_expiration(days=7, extended_by_user=request.user)
-                count += 1
-            except Exception as e:
-                self.message_user(
-                    request,
-                    f"Error extending request {req.pk}: {str(e)}",
-                    level=messages.ERROR
-                )
-
-        self.message_user(
-            request,
-            f"Successfully extended {count} request(s) by 7 days.",
-            level=messages.SUCCESS
-        )
+        self._extend_pending(request, queryset, days=7)
     extend_expiration_7_days.short_description = "Extend expiration by 7 days"
+    extend_expiration_7_days.allowed_permissions = ('manage_expiration',)
 
     def manually_expire_requests(self, request, queryset):
         """Manually expire selected pending requests."""
-        if not request.user.is_manager and not request.user.is_superuser:
-            self.message_user(
-                request,
-                "Only managers can manually expire requests.",
-                level=messages.ERROR
-            )
-            return
-
-        from notifications.utils import notify_request_expired
+        from notifications.utils import (
+            create_notifications, notify_request_expired, send_bulk_notification_emails
+        )
 
-        pending_requests = queryset.filter(status=TransferRequest.Status.PENDING)
-        count = 0
+        expired_ids = TransferRequest.bulk_expire(queryset, expired_by_user=request.user)
+        count = len(expired_ids)
+        expired = TransferRequest.objects.filter(pk__in=expired_ids)
 
-        for req in pending_requests:
+        # Notifications go out once the expiry is committed. The in-app rows
+        # for every request are inserted together (one failing request only
+        # skips its own notifications); all emails share one SMTP connection.
+        emails = []
+        notifications = []
+        for req in expired.with_related():
             try:
-                req.expire(expired_by_user=request.user)
-                notify_request_expired(req)
-                count += 1
+                notify_request_expired(req, emails=emails, notifications=notifications)
             except Exception as e:
                 self.message_user(
                     request,
-                    f"Error expiring request {req.pk}: {str(e)}",
+                    f"Error notifying request {req.pk}: {str(e)}",
                     level=messages.ERROR
                 )
+        create_notifications(notifications)
+        send_bulk_notification_emails(emails)
 
         self.message_user(
             request,
@@ -198,6 +198,7 @@ class TransferRequestAdmin(admin.ModelAdmin):
             level=messages.SUCCESS
         )
     manually_expire_requests.short_description = "Manually expire selected requests"
+    manually_expire_requests.allowed_permissions = ('manage_expiration',)
 
 
 @admin.register(TransferLog)
@@ -208,14 +209,23 @@ class TransferLogAdmin(admin.ModelAdmin):
         'item', 'from_user', 'to_user',
         'transferred_at', 'is_forced'
     ]
+    list_select_related = ['item', 'from_user', 'to_user']
+    show_full_result_count = False
     list_filter = ['is_forced', 'transferred_at']
-    search_fields = ['item__asset_id', 'from_user__email', 'to_user__email', 'notes']
+    search_fields = ['item__asset_id', 'from_user__email', 'to_user__email']
     ordering = ['-transferred_at']
     readonly_fields = [
         'item', 'from_user', 'to_user', 'request',
         'transferred_at', 'notes', 'is_forced'
     ]
 
+    def get_queryset(self, request):
+        """Join the relations rendered by __str__ and the read-only fields."""
+        return super().get_queryset(request).select_related(
+            'item', 'from_user', 'to_user',
+            'request__item', 'request__from_user', 'request__to_user'
+        )
+
     def has_add_permission(self, request):
         """Transfer logs are created automatically, not manually."""
         return False
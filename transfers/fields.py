@@ -0,0 +1,29 @@
+"""
+Custom model fields for the transfers app.
+"""
+
+from django.db import models
+
+
+class PostgresEnumField(models.CharField):
+    """
+    CharField stored as a native PostgreSQL ENUM type.
+
+    Python values stay plain strings; only the column type changes. On other
+    backends the column is an ordinary varchar. The ENUM type itself must be
+    created by a migration before the field uses it.
+    """
+
+    def __init__(self, *args, enum_type=None, **kwargs):
+        self.enum_type = enum_type
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs['enum_type'] = self.enum_type
+        return name, path, args, kwargs
+
+    def db_type(self, connection):
+        if connection.vendor == 'postgresql' and self.enum_type:
+            return self.enum_type
+        return super().db_type(connection)
@@ -2,13 +2,42 @@
 Forms for transfer workflow.
 """
 
+from operator import attrgetter
+
 from django import forms
+from django.db.models import CharField, Value
+from django.db.models.functions import Concat
 from .models import TransferRequest
 from items.models import Item
 from users.models import User
 from locations.models import Location
 
 
+# Shared widget attributes (widgets copy attrs, so sharing the dicts is safe)
+INPUT_CLASS = 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500'
+INPUT_CLASS_RED = 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-red-500'
+INPUT_CLASS_YELLOW = 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-yellow-500'
+INPUT_ATTRS = {'class': INPUT_CLASS}
+
+
+def assignable_item_queryset(statuses):
+    """Items offered in the transfer forms, narrowed to what the form reads."""
+    # __str__ needs asset_id/name; status and current_owner are read by
+    # TransferRequest.clean()/save() on the selected item
+    return Item.objects.filter(status__in=statuses).only(
+        'id', 'asset_id', 'name', 'status', 'current_owner'
+    )
+
+
+def transfer_recipient_queryset():
+    """Active members and staff who can receive a transfer."""
+    # __str__ shows the full name (or email) plus the role
+    return User.objects.filter(
+        role__in=[User.Role.MEMBER, User.Role.STAFF],
+        is_active=True
+    ).only('id', 'email', 'first_name', 'last_name', 'role')
+
+
 class TransferRequestForm(forms.ModelForm):
     """Form for creating a transfer request (Staff → Teacher)."""
 
@@ -16,14 +45,10 @@ class TransferRequestForm(forms.ModelForm):
         model = TransferRequest
         fields = ['item', 'to_user', 'notes']
         widgets = {
-            'item': forms.Select(attrs={
-                'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500'
-            }),
-            'to_user': forms.Select(attrs={
-                'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500'
-            }),
+            'item': forms.Select(attrs=INPUT_ATTRS),
+            'to_user': forms.Select(attrs=INPUT_ATTRS),
             'notes': forms.Textarea(attrs={
-                'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500',
+                **INPUT_ATTRS,
                 'rows': 3,
                 'placeholder': 'Notes (optional)'
             }),
@@ -33,17 +58,16 @@ class TransferRequestForm(forms.ModelForm):
         self.request_user = kwargs.pop('request_user', None)
         super().__init__(*args, **kwargs)
 
+        # create_transfer_request relies on the partial unique index (and
+        # catches its IntegrityError) rather than a validation SELECT
+        self.instance._defer_pending_item_check = True
+
         # Show all available items (Staff/Manager can assign any item to teachers)
         if self.request_user:
-            self.fields['item'].queryset = Item.objects.filter(
-                status__in=['NORMAL', 'DAMAGED']
-            ).select_related('current_owner', 'category')
+            self.fields['item'].queryset = assignable_item_queryset(['NORMAL', 'DAMAGED'])
 
-        # Show both teachers and staff for transfer
-        self.fields['to_user'].queryset = User.objects.filter(
-            role__in=['TEACHER', 'STAFF'],
-            is_active=True
-        )
+        # Show both members and staff for transfer
+        self.fields['to_user'].queryset = transfer_recipient_queryset()
 
 
 class ReturnRequestForm(forms.Form):
@@ -52,7 +76,7 @@ class ReturnRequestForm(forms.Form):
     notes = forms.CharField(
         required=False,
         widget=forms.Textarea(attrs={
-            'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500',
+            **INPUT_ATTRS,
             'rows': 3,
             'placeholder': 'Condition notes or reason for return (optional)'
         }),
@@ -64,10 +88,14 @@ class AcceptTransferForm(forms.Form):
     """Form for accepting a transfer (ASSIGN) with required current_location."""
 
     current_location = forms.ModelChoiceField(
-        queryset=Location.objects.filter(is_active=True),
-        widget=forms.Select(attrs={
-            'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500'
-        }),
+        # Option label is built by the database; only pk + label are fetched
+        queryset=Location.objects.filter(is_active=True).annotate(
+            label=Concat(
+                'building', Value(' - Floor '), 'floor', Value(' - Room '), 'room',
+                output_field=CharField()
+            )
+        ).only('id'),
+        widget=forms.Select(attrs=INPUT_ATTRS),
         label='Current Location',
         help_text='Where will you keep this item? (Required)',
         required=True
@@ -76,17 +104,16 @@ class AcceptTransferForm(forms.Form):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # Custom label for location dropdown
-        self.fields['current_location'].label_from_instance = lambda obj: f"{obj.building} - Floor {obj.floor} - Room {obj.room}"
+        self.fields['current_location'].label_from_instance = attrgetter('label')
 
 
 class AcceptReturnForm(forms.Form):
     """Form for accepting a return with status selection."""
 
     new_status = forms.ChoiceField(
-        choices=Item.Status.choices,
-        widget=forms.Select(attrs={
-            'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500'
-        }),
+        # Callable: resolved when the form is instantiated, not at import
+        choices=lambda: Item.Status.choices,
+        widget=forms.Select(attrs=INPUT_ATTRS),
         label='New Item Status',
         help_text='Select the status of the item after inspection'
     )
@@ -98,7 +125,7 @@ class RejectRequestForm(forms.Form):
     reason = forms.CharField(
         required=True,
         widget=forms.Textarea(attrs={
-            'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-red-500',
+            'class': INPUT_CLASS_RED,
             'rows': 3,
             'placeholder': 'Reason for rejection'
         }),
@@ -113,22 +140,16 @@ class EditTransferRequestForm(forms.ModelForm):
         model = TransferRequest
         fields = ['item', 'to_user', 'request_type', 'notes', 'expires_at']
         widgets = {
-            'item': forms.Select(attrs={
-                'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500'
-            }),
-            'to_user': forms.Select(attrs={
-                'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500'
-            }),
-            'request_type': forms.Select(attrs={
-                'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500'
-            }),
+            'item': forms.Select(attrs=INPUT_ATTRS),
+            'to_user': forms.Select(attrs=INPUT_ATTRS),
+            'request_type': forms.Select(attrs=INPUT_ATTRS),
             'notes': forms.Textarea(attrs={
-                'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500',
+                **INPUT_ATTRS,
                 'rows': 3,
                 'placeholder': 'Notes (optional)'
             }),
             'expires_at': forms.DateTimeInput(attrs={
-                'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500',
+                **INPUT_ATTRS,
                 'type': 'datetime-local'
             }),
         }
@@ -139,15 +160,12 @@ class EditTransferRequestForm(forms.ModelForm):
 
         # Show all available items (Staff/Manager can assign any item to teachers)
         if self.request_user:
-            self.fields['item'].queryset = Item.objects.filter(
-                status__in=['NORMAL', 'DAMAGED', 'PENDING_INSPECTION']
-            ).select_related('current_owner', 'category')
+            self.fields['item'].queryset = assignable_item_queryset(
+                ['NORMAL', 'DAMAGED', 'PENDING_INSPECTION']
+            )
 
-        # Show both teachers and staff for transfer
-        self.fields['to_user'].queryset = User.objects.filter(
-            role__in=['TEACHER', 'STAFF'],
-            is_active=True
-        )
+        # Show both members and staff for transfer
+        self.fields['to_user'].queryset = transfer_recipient_queryset()
 
         # Add labels
         self.fields['request_type'].label = 'Request Type'
@@ -163,7 +181,7 @@ class ExtendRequestForm(forms.Form):
         max_value=30,
         initial=7,
         widget=forms.NumberInput(attrs={
-            'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500',
+            **INPUT_ATTRS,
             'placeholder': 'Number of days'
         }),
         label='Extend by (days)',
@@ -173,7 +191,7 @@ class ExtendRequestForm(forms.Form):
     notes = forms.CharField(
         required=False,
         widget=forms.Textarea(attrs={
-            'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500',
+            **INPUT_ATTRS,
             'rows': 2,
             'placeholder': 'Reason for extension (optional)'
         }),
@@ -187,7 +205,7 @@ class CancelRequestForm(forms.Form):
     reason = forms.CharField(
         required=False,
         widget=forms.Textarea(attrs={
-            'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-yellow-500',
+            'class': INPUT_CLASS_YELLOW,
             'rows': 3,
             'placeholder': 'Reason for cancellation (optional)'
         }),
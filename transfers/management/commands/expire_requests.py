@@ -10,8 +10,10 @@ Usage:
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from transfers.models import TransferRequest
-from transfers.tasks import check_expiring_requests
-from notifications.utils import notify_request_expiring_soon, notify_request_expired
+from notifications.utils import (
+    create_notifications, notify_request_expired, notify_request_expiring_soon,
+    send_bulk_notification_emails
+)
 
 
 class Command(BaseCommand):
@@ -39,16 +41,18 @@ class Command(BaseCommand):
 
         now = timezone.now()
 
-        # Get all pending requests
+        # Effective deadline (extended or original) computed in SQL so each
+        # bucket below is a single filtered query
         pending_requests = TransferRequest.objects.filter(
             status=TransferRequest.Status.PENDING
-        ).select_related('item', 'to_user', 'from_user')
+        ).annotate_expiry()
 
-        if not pending_requests.exists():
+        total = pending_requests.count()
+        if not total:
             self.stdout.write(self.style.SUCCESS('No pending requests found.'))
             return
 
-        self.stdout.write(f'Found {pending_requests.count()} pending requests')
+        self.stdout.write(f'Found {total} pending requests')
         self.stdout.write('')
 
         stats = {
@@ -58,51 +62,66 @@ class Command(BaseCommand):
             'pending': 0
         }
 
-        for request in pending_requests:
-            # Determine effective deadline (extended or original)
-            deadline = request.expiration_extended_until or request.expires_at
-
-            if not deadline:
-                if verbose:
-                    self.stdout.write(
-                        f'  Request {request.pk}: No expiration date set'
+        # Same windows as before: expired when no time is left, warnings
+        # when 24-25 / 48-49 hours remain and not already sent
+        # bulk_expire() works from the pks, so only the columns needed for
+        # output are loaded here
+        expired_requests = list(
+            pending_requests.filter(computed_deadline__lte=now)
+            .select_related('item').only('item__asset_id')
+        )
+        warn_24h_requests = list(TransferRequest.objects.due_for_warning(24, now))
+        warn_48h_requests = list(TransferRequest.objects.due_for_warning(48, now))
+
+        # Expired
+        for request in expired_requests:
+            stats['expired'] += 1
+            if dry_run:
+                days_remaining = (request.computed_deadline - now).days
+                self.stdout.write(
+                    self.style.ERROR(
+                        f'  [WOULD EXPIRE] Request {request.pk}: '
+                        f'{request.item.asset_id} (expired {abs(days_remaining)} days ago)'
                     )
-                stats['pending'] += 1
-                continue
-
-            time_until_expiry = deadline - now
-            hours_remaining = time_until_expiry.total_seconds() / 3600
-            days_remaining = time_until_expiry.days
-
-            # Expired
-            if hours_remaining <= 0:
-                stats['expired'] += 1
-                if dry_run:
+                )
+            else:
+                if verbose:
                     self.stdout.write(
                         self.style.ERROR(
-                            f'  [WOULD EXPIRE] Request {request.pk}: '
-                            f'{request.item.asset_id} (expired {abs(days_remaining)} days ago)'
+                            f'  [EXPIRING] Request {request.pk}: '
+                            f'{request.item.asset_id}'
                         )
                     )
-                else:
-                    if verbose:
-                        self.stdout.write(
-                            self.style.ERROR(
-                                f'  [EXPIRING] Request {request.pk}: '
-                                f'{request.item.asset_id}'
-                            )
-                        )
-                    # Actually expire the request
-                    from transfers.tasks import _expire_request
-                    _expire_request(request)
 
-            # 24-hour warning
-            elif 24 <= hours_remaining < 25 and not request.warning_24h_sent:
-                stats['warnings_24h'] += 1
+        # All in-app notifications and emails are collected, then inserted in
+        # bulk and sent over one SMTP connection at the end
+        emails = []
+        notifications = []
+
+        # Actually expire the requests in one pass (re-checks PENDING under
+        # lock, reverts RETURN items), then notify both parties of each
+        if expired_requests and not dry_run:
+            expired_ids = TransferRequest.bulk_expire(
+                TransferRequest.objects.filter(pk__in=[r.pk for r in expired_requests]),
+                now=now
+            )
+            for request in TransferRequest.objects.filter(pk__in=expired_ids).with_related():
+                notify_request_expired(request, emails=emails, notifications=notifications)
+
+        # Warnings: notify each request, then set the flags in one UPDATE
+        for hours, requests, flag in (
+            (24, warn_24h_requests, 'warning_24h_sent'),
+            (48, warn_48h_requests, 'warning_48h_sent'),
+        ):
+            stats[f'warnings_{hours}h'] = len(requests)
+            for request in requests:
                 if dry_run:
+                    # Only the preview reports the exact time left; the window
+                    # bounds themselves are computed once in due_for_warning()
+                    hours_remaining = (request.computed_deadline - now).total_seconds() / 3600
                     self.stdout.write(
                         self.style.WARNING(
-                            f'  [WOULD SEND 24h WARNING] Request {request.pk}: '
+                            f'  [WOULD SEND {hours}h WARNING] Request {request.pk}: '
                             f'{request.item.asset_id} (expires in {hours_remaining:.1f} hours)'
                         )
                     )
@@ -110,45 +129,43 @@ class Command(BaseCommand):
                     if verbose:
                         self.stdout.write(
                             self.style.WARNING(
-                                f'  [SENDING 24h WARNING] Request {request.pk}: '
+                                f'  [SENDING {hours}h WARNING] Request {request.pk}: '
                                 f'{request.item.asset_id}'
                             )
                         )
-                    notify_request_expiring_soon(request, hours_remaining=24)
-                    request.warning_24h_sent = True
-                    request.save(update_fields=['warning_24h_sent', 'updated_at'])
-
-            # 48-hour warning
-            elif 48 <= hours_remaining < 49 and not request.warning_48h_sent:
-                stats['warnings_48h'] += 1
-                if dry_run:
-                    self.stdout.write(
-                        self.style.WARNING(
-                            f'  [WOULD SEND 48h WARNING] Request {request.pk}: '
-                            f'{request.item.asset_id} (expires in {hours_remaining:.1f} hours)'
-                        )
+                    notify_request_expiring_soon(
+                        request, hours_remaining=hours, emails=emails, notifications=notifications
                     )
-                else:
-                    if verbose:
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f'  [SENDING 48h WARNING] Request {request.pk}: '
-                                f'{request.item.asset_id}'
-                            )
-                        )
-                    notify_request_expiring_soon(request, hours_remaining=48)
-                    request.warning_48h_sent = True
-                    request.save(update_fields=['warning_48h_sent', 'updated_at'])
 
-            # Still pending
-            else:
-                stats['pending'] += 1
-                if verbose:
+            if requests and not dry_run:
+                TransferRequest.objects.filter(
+                    pk__in=[request.pk for request in requests]
+                ).update(**{flag: True, 'updated_at': now})
+
+        create_notifications(notifications)
+        send_bulk_notification_emails(emails)
+
+        # Still pending
+        stats['pending'] = (
+            total - stats['expired'] - stats['warnings_24h'] - stats['warnings_48h']
+        )
+        if verbose:
+            handled = [r.pk for r in expired_requests + warn_24h_requests + warn_48h_requests]
+            remaining = pending_requests.exclude(pk__in=handled).select_related(
+                'item'
+            ).only('item__asset_id')
+            # Stream the (potentially large) remainder instead of caching it
+            for request in remaining.iterator(chunk_size=500):
+                if not request.computed_deadline:
                     self.stdout.write(
-                        f'  Request {request.pk}: '
-                        f'{request.item.asset_id} - '
-                        f'{days_remaining} days remaining'
+                        f'  Request {request.pk}: No expiration date set'
                     )
+                    continue
+                self.stdout.write(
+                    f'  Request {request.pk}: '
+                    f'{request.item.asset_id} - '
+                    f'{(request.computed_deadline - now).days} days remaining'
+                )
 
         # Summary
         self.stdout.write('')
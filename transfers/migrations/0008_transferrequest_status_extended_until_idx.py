@@ -0,0 +1,20 @@
+# Generated by Django 5.0.14 on 2026-10-15 22:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0006_item_items_item_categor_ac6954_idx_and_more'),
+        ('transfers', '0007_alter_transferrequest_status'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transferrequest',
+            index=models.Index(fields=['status', 'expiration_extended_until'], name='transfers_t_status_663332_idx'),
+        ),
+    ]
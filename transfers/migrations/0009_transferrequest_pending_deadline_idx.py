@@ -0,0 +1,21 @@
+# Generated by Django 5.0.14 on 2026-10-15 22:49
+
+import django.db.models.functions.comparison
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0006_item_items_item_categor_ac6954_idx_and_more'),
+        ('transfers', '0008_transferrequest_status_extended_until_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transferrequest',
+            index=models.Index(django.db.models.functions.comparison.Coalesce('expiration_extended_until', 'expires_at'), condition=models.Q(('status', 'PENDING')), name='transfers_pending_deadline_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.0.14 on 2026-10-15 22:49
+
+import django.db.models.functions.comparison
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0006_item_items_item_categor_ac6954_idx_and_more'),
+        ('transfers', '0009_transferrequest_pending_deadline_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='transferrequest',
+            name='transfers_t_status_f55771_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='transferrequest',
+            name='transfers_t_status_2680c5_idx',
+        ),
+        migrations.AddIndex(
+            model_name='transferrequest',
+            index=models.Index(django.db.models.functions.comparison.Coalesce('expiration_extended_until', 'expires_at'), condition=models.Q(('status', 'PENDING'), ('warning_48h_sent', False)), name='transfers_pending_warn48_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transferrequest',
+            index=models.Index(django.db.models.functions.comparison.Coalesce('expiration_extended_until', 'expires_at'), condition=models.Q(('status', 'PENDING'), ('warning_24h_sent', False)), name='transfers_pending_warn24_idx'),
+        ),
+    ]
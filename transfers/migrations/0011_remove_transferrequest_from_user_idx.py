@@ -0,0 +1,17 @@
+# Generated by Django 5.0.14 on 2026-10-15 22:49
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transfers', '0010_transferrequest_partial_warning_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='transferrequest',
+            name='transfers_t_from_us_7c5194_idx',
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated migration to enforce TransferLog immutability in the database (PostgreSQL only)
+
+from django.db import migrations
+
+
+# Transfer logs are an append-only audit trail. On PostgreSQL a BEFORE UPDATE
+# trigger rejects any modification, whatever code path issues it (save(),
+# queryset.update(), raw SQL); other backends keep the check in
+# TransferLog.save().
+CREATE_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION prevent_transferlog_update() RETURNS trigger AS $$
+BEGIN
+    RAISE EXCEPTION 'Transfer logs cannot be modified after creation.';
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS transferlog_no_update ON transfers_transferlog;
+CREATE TRIGGER transferlog_no_update
+    BEFORE UPDATE ON transfers_transferlog
+    FOR EACH ROW EXECUTE FUNCTION prevent_transferlog_update();
+"""
+
+DROP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS transferlog_no_update ON transfers_transferlog;
+DROP FUNCTION IF EXISTS prevent_transferlog_update();
+"""
+
+
+def create_immutability_trigger(apps, schema_editor):
+    """Install the BEFORE UPDATE trigger on transfer logs."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute(CREATE_TRIGGER_SQL)
+
+
+def drop_immutability_trigger(apps, schema_editor):
+    """Reverse migration: remove the trigger and its function."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute(DROP_TRIGGER_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transfers', '0011_remove_transferrequest_from_user_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_immutability_trigger,
+            reverse_code=drop_immutability_trigger
+        ),
+    ]
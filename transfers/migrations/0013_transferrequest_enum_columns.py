@@ -0,0 +1,87 @@
+# Generated by Django 5.0.14 on 2026-10-15 22:58
+
+import django.db.models.functions.comparison
+import transfers.fields
+from django.db import migrations, models
+
+
+# status and request_type hold a handful of fixed values; on PostgreSQL they
+# are stored as native ENUM types (4 bytes) instead of varchar. The values
+# are frozen here on purpose: adding a choice later needs its own
+# ALTER TYPE ... ADD VALUE migration.
+ENUM_TYPES = [
+    ('transfer_request_type', ['ASSIGN', 'RETURN']),
+    ('transfer_status', ['PENDING', 'ACCEPTED', 'REJECTED', 'EXPIRED', 'CANCELLED']),
+]
+
+
+def create_enum_types(apps, schema_editor):
+    """Create the ENUM types used by the altered columns."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for name, values in ENUM_TYPES:
+        labels = ', '.join(f"'{value}'" for value in values)
+        schema_editor.execute(f'CREATE TYPE {name} AS ENUM ({labels})')
+
+
+def drop_enum_types(apps, schema_editor):
+    """Reverse migration: drop the ENUM types once the columns are varchar again."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for name, _ in ENUM_TYPES:
+        schema_editor.execute(f'DROP TYPE IF EXISTS {name}')
+
+
+# Partial indexes and the constraint whose predicates compare status against a
+# literal. Left in place, PostgreSQL rebuilds them during the type change with
+# the literal still typed as varchar, which either fails or leaves predicates
+# the planner can't match against enum comparisons. They are dropped before
+# the AlterFields and recreated, unchanged, on the enum column afterwards.
+PENDING_INDEXES = [
+    models.Index(django.db.models.functions.comparison.Coalesce('expiration_extended_until', 'expires_at'), condition=models.Q(('status', 'PENDING')), name='transfers_pending_deadline_idx'),
+    models.Index(django.db.models.functions.comparison.Coalesce('expiration_extended_until', 'expires_at'), condition=models.Q(('status', 'PENDING'), ('warning_48h_sent', False)), name='transfers_pending_warn48_idx'),
+    models.Index(django.db.models.functions.comparison.Coalesce('expiration_extended_until', 'expires_at'), condition=models.Q(('status', 'PENDING'), ('warning_24h_sent', False)), name='transfers_pending_warn24_idx'),
+]
+PENDING_CONSTRAINT = models.UniqueConstraint(condition=models.Q(('status', 'PENDING')), fields=('item',), name='unique_pending_request_per_item')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transfers', '0012_transferlog_immutable_trigger'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_enum_types,
+            reverse_code=drop_enum_types
+        ),
+        migrations.RemoveConstraint(
+            model_name='transferrequest',
+            name=PENDING_CONSTRAINT.name,
+        ),
+        *[
+            migrations.RemoveIndex(model_name='transferrequest', name=index.name)
+            for index in PENDING_INDEXES
+        ],
+        migrations.AlterField(
+            model_name='transferrequest',
+            name='request_type',
+            field=transfers.fields.PostgresEnumField(choices=[('ASSIGN', 'Assign to User'), ('RETURN', 'Return to Staff')], enum_type='transfer_request_type', max_length=10, verbose_name='Request Type'),
+        ),
+        migrations.AlterField(
+            model_name='transferrequest',
+            name='status',
+            field=transfers.fields.PostgresEnumField(choices=[('PENDING', 'Pending'), ('ACCEPTED', 'Accepted'), ('REJECTED', 'Rejected'), ('EXPIRED', 'Expired'), ('CANCELLED', 'Cancelled')], default='PENDING', enum_type='transfer_status', max_length=10, verbose_name='Status'),
+        ),
+        *[
+            migrations.AddIndex(model_name='transferrequest', index=index)
+            for index in PENDING_INDEXES
+        ],
+        migrations.AddConstraint(
+            model_name='transferrequest',
+            constraint=PENDING_CONSTRAINT,
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.0.14 on 2026-10-15 23:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0006_item_items_item_categor_ac6954_idx_and_more'),
+        ('transfers', '0013_transferrequest_enum_columns'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transferrequest',
+            index=models.Index(fields=['request_type', 'status'], name='transfers_t_request_8f1860_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transferrequest',
+            index=models.Index(fields=['to_user', 'request_type', 'status'], name='transfers_t_to_user_c7cdcd_idx'),
+        ),
+    ]
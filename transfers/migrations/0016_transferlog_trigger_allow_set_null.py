@@ -0,0 +1,63 @@
+# Generated migration to let the TransferLog trigger allow ON DELETE SET NULL (PostgreSQL only)
+
+from django.db import migrations
+
+
+# The 0012 trigger rejected every UPDATE, including the
+# "SET item_id = NULL" / "SET request_id = NULL" that Django issues when an
+# item or request is deleted (both FKs are on_delete=SET_NULL), so hard
+# deletes failed. The audit columns stay immutable; the two links may only
+# be cleared.
+REPLACE_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION prevent_transferlog_update() RETURNS trigger AS $$
+BEGIN
+    IF ROW(NEW.id, NEW.from_user_id, NEW.to_user_id, NEW.transferred_at, NEW.notes, NEW.is_forced)
+            IS DISTINCT FROM
+       ROW(OLD.id, OLD.from_user_id, OLD.to_user_id, OLD.transferred_at, OLD.notes, OLD.is_forced)
+       OR (NEW.item_id IS NOT NULL AND NEW.item_id IS DISTINCT FROM OLD.item_id)
+       OR (NEW.request_id IS NOT NULL AND NEW.request_id IS DISTINCT FROM OLD.request_id)
+    THEN
+        RAISE EXCEPTION 'Transfer logs cannot be modified after creation.';
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+RESTORE_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION prevent_transferlog_update() RETURNS trigger AS $$
+BEGIN
+    RAISE EXCEPTION 'Transfer logs cannot be modified after creation.';
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def allow_set_null(apps, schema_editor):
+    """Replace the trigger function with the SET NULL-tolerant version."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute(REPLACE_FUNCTION_SQL)
+
+
+def restore_strict_trigger(apps, schema_editor):
+    """Reverse migration: reject every UPDATE again."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute(RESTORE_FUNCTION_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transfers', '0015_transferrequest_status_from_user_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            allow_set_null,
+            reverse_code=restore_strict_trigger
+        ),
+    ]
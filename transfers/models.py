@@ -1,7 +1,83 @@
+from datetime import timedelta
+
 from django.db import models
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.db import transaction
+from django.db import connection, transaction
+from django.db.models import (
+    Case, ExpressionWrapper, F, OuterRef, Q, Subquery, TextField, Value, When
+)
+from django.db.models.functions import Coalesce, Concat, Now, NullIf
+from django.utils import timezone
+
+from .fields import PostgresEnumField
+
+
+class TransferRequestQuerySet(models.QuerySet):
+    """QuerySet helpers for transfer requests."""
+
+    # Columns read by notify_request_expiring_soon() (including its email
+    # template); everything else on the row is skipped by due_for_warning()
+    WARNING_FIELDS = (
+        'expires_at', 'expiration_extended_until', 'status',
+        'warning_24h_sent', 'warning_48h_sent',
+        'item__asset_id', 'item__name',
+        'to_user__email', 'to_user__first_name', 'to_user__last_name',
+        'to_user__disable_expiration_emails',
+        'from_user__email', 'from_user__first_name', 'from_user__last_name',
+    )
+
+    def with_related(self):
+        """Join the relations used by __str__ and list templates."""
+        return self.select_related('item', 'from_user', 'to_user')
+
+    def annotate_expiry(self):
+        """
+        Annotate the effective deadline and expiry flag in SQL.
+
+        computed_deadline: extended deadline if set, else the original one
+        is_expired_db: pending and past computed_deadline (like can_expire())
+        """
+        return self.annotate(
+            computed_deadline=Coalesce('expiration_extended_until', 'expires_at')
+        ).annotate(
+            is_expired_db=ExpressionWrapper(
+                Q(status='PENDING', computed_deadline__lte=Now()),
+                output_field=models.BooleanField()
+            )
+        )
+
+    def due_for_warning(self, hours, now):
+        """
+        Pending requests due an expiry warning.
+
+        Selects requests whose effective deadline is between `hours` and
+        `hours + 1` from now and whose warning_<hours>h_sent flag is unset,
+        annotated with computed_deadline and loaded with WARNING_FIELDS only.
+        """
+        return self.filter(
+            status='PENDING', **{f'warning_{hours}h_sent': False}
+        ).annotate(
+            computed_deadline=Coalesce('expiration_extended_until', 'expires_at')
+        ).filter(
+            computed_deadline__gte=now + timedelta(hours=hours),
+            computed_deadline__lt=now + timedelta(hours=hours + 1)
+        ).select_related('item', 'to_user', 'from_user').only(*self.WARNING_FIELDS)
+
+    def pending_expired(self):
+        """Pending requests whose effective deadline has passed."""
+        return self.filter(status='PENDING').annotate(
+            computed_deadline=Coalesce('expiration_extended_until', 'expires_at')
+        ).filter(computed_deadline__lte=Now())
+
+
+class TransferLogQuerySet(models.QuerySet):
+    """QuerySet helpers for transfer logs."""
+
+    def with_related(self):
+        """Join the relations used by __str__ and list templates."""
+        return self.select_related('item', 'from_user', 'to_user')
 
 
 class TransferRequest(models.Model):
@@ -21,14 +97,27 @@ class TransferRequest(models.Model):
         EXPIRED = 'EXPIRED', 'Expired'
         CANCELLED = 'CANCELLED', 'Cancelled'
 
-    # Request metadata
-    request_type = models.CharField(
+    # Precomputed label lookups for __str__ and validation messages, cheaper
+    # than the get_*_display() descriptor path on large admin pages
+    _REQUEST_TYPE_LABELS = dict(RequestType.choices)
+    _STATUS_LABELS = dict(Status.choices)
+
+    # transfer_overview caches each user's counters this long (seconds);
+    # writes that change a request clear both parties' entries and the
+    # global completed count (same for every user, so cached once)
+    OVERVIEW_CACHE_TIMEOUT = 30
+    COMPLETED_CACHE_KEY = 'transfers:overview:completed'
+
+    # Request metadata (native ENUM columns on PostgreSQL, see migration 0013)
+    request_type = PostgresEnumField(
         max_length=10,
+        enum_type='transfer_request_type',
         choices=RequestType.choices,
         verbose_name='Request Type'
     )
-    status = models.CharField(
+    status = PostgresEnumField(
         max_length=10,
+        enum_type='transfer_status',
         choices=Status.choices,
         default=Status.PENDING,
         verbose_name='Status'
@@ -123,18 +212,43 @@ class TransferRequest(models.Model):
         help_text='Whether 24-hour expiration warning has been sent'
     )
 
+    objects = TransferRequestQuerySet.as_manager()
+
+    # Set on instances whose creator handles the unique-pending IntegrityError
+    # itself (see validate_constraints)
+    _defer_pending_item_check = False
+
     class Meta:
         verbose_name = 'Transfer Request'
         verbose_name_plural = 'Transfer Requests'
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['status', 'to_user']),
+            models.Index(fields=['status', 'from_user']),  # "Requests I sent" lists
             models.Index(fields=['item', 'status']),
+            # Staff pending page: all pending returns / assigns sent to me
+            models.Index(fields=['request_type', 'status']),
+            models.Index(fields=['to_user', 'request_type', 'status']),
             models.Index(fields=['expires_at']),  # For expiration batch jobs
-            models.Index(fields=['from_user']),  # For user permission checks
             models.Index(fields=['status', 'expires_at']),  # For expiration queries
-            models.Index(fields=['status', 'warning_48h_sent']),  # For warning queries
-            models.Index(fields=['status', 'warning_24h_sent']),  # For warning queries
+            models.Index(fields=['status', 'expiration_extended_until']),  # For extended deadlines
+            # Effective deadline of pending requests (see annotate_expiry)
+            models.Index(
+                Coalesce('expiration_extended_until', 'expires_at'),
+                condition=Q(status='PENDING'),
+                name='transfers_pending_deadline_idx'
+            ),
+            # Warning sweeps: pending, warning not yet sent, deadline in window
+            models.Index(
+                Coalesce('expiration_extended_until', 'expires_at'),
+                condition=Q(status='PENDING', warning_48h_sent=False),
+                name='transfers_pending_warn48_idx'
+            ),
+            models.Index(
+                Coalesce('expiration_extended_until', 'expires_at'),
+                condition=Q(status='PENDING', warning_24h_sent=False),
+                name='transfers_pending_warn24_idx'
+            ),
         ]
         constraints = [
             models.UniqueConstraint(
@@ -145,7 +259,15 @@ class TransferRequest(models.Model):
         ]
 
     def __str__(self):
-        return f"{self.get_request_type_display()}: {self.item.asset_id} from {self.from_user.email} to {self.to_user.email}"
+        """
+        Full description when item/from_user/to_user are loaded (see
+        with_related()); otherwise a pk-only form so that logging an
+        unjoined request never triggers queries.
+        """
+        fields_cache = self._state.fields_cache
+        if not all(name in fields_cache for name in ('item', 'from_user', 'to_user')):
+            return f"TransferRequest#{self.pk}"
+        return f"{self._REQUEST_TYPE_LABELS.get(self.request_type, self.request_type)}: {self.item.asset_id} from {self.from_user.email} to {self.to_user.email}"
 
     def save(self, *args, **kwargs):
         """
@@ -153,24 +275,91 @@ class TransferRequest(models.Model):
         For RETURN requests, capture original item status before PENDING_INSPECTION.
         """
         if not self.pk:
-            # Set expiration date if not already set
-            if not self.expires_at:
-                from django.utils import timezone
-                from datetime import timedelta
-                self.expires_at = timezone.now() + timedelta(days=7)
-
-            # For RETURN requests, capture original item status
-            if self.request_type == self.RequestType.RETURN and self.item:
-                # Store the status before it might be changed to PENDING_INSPECTION
-                if not self.original_item_status:
-                    self.original_item_status = self.item.status
+            self._set_creation_defaults(timezone.now())
 
         super().save(*args, **kwargs)
+        self.clear_overview_cache([self.from_user_id, self.to_user_id])
+
+    def validate_constraints(self, exclude=None):
+        """
+        Optionally skip the one-pending-request-per-item check.
+
+        Only when _defer_pending_item_check is set (TransferRequestForm, used
+        by create_transfer_request): that view catches the IntegrityError
+        from the partial unique index on INSERT instead of paying a SELECT
+        here. Every other full_clean() (edit form, admin) keeps the check so
+        a conflict is reported as a form error.
+        """
+        if self._defer_pending_item_check:
+            exclude = set(exclude or ()) | {'item'}
+        super().validate_constraints(exclude=exclude)
+
+    def _set_creation_defaults(self, now):
+        """Fill expires_at and (for RETURN requests) original_item_status on a new request."""
+        # Set expiration date if not already set
+        if not self.expires_at:
+            self.expires_at = now + timedelta(days=7)
+
+        # For RETURN requests, capture original item status
+        if self.request_type == self.RequestType.RETURN and self.item:
+            # Store the status before it might be changed to PENDING_INSPECTION
+            if not self.original_item_status:
+                self.original_item_status = self.item.status
+
+    @classmethod
+    def bulk_create_requests(cls, objs):
+        """
+        Create many new requests in batched INSERTs.
+
+        Applies the same creation defaults as save(), with one shared
+        timestamp so every request in the batch gets the same expires_at.
+
+        Args:
+            objs: Unsaved TransferRequest instances
+
+        Returns:
+            list: The created TransferRequest instances
+        """
+        now = timezone.now()
+        for obj in objs:
+            obj._set_creation_defaults(now)
+        created = cls.objects.bulk_create(objs, batch_size=500)
+        cls.clear_overview_cache(
+            [obj.from_user_id for obj in created] + [obj.to_user_id for obj in created]
+        )
+        return created
+
+    @property
+    def request_type_label(self):
+        """Display label of request_type (dict lookup, for per-row list templates)."""
+        return self._REQUEST_TYPE_LABELS.get(self.request_type, self.request_type)
+
+    @property
+    def status_label(self):
+        """Display label of status (dict lookup, for per-row list templates)."""
+        return self._STATUS_LABELS.get(self.status, self.status)
+
+    @staticmethod
+    def overview_cache_key(user_id):
+        """Cache key of a user's transfer_overview counters."""
+        return f'transfers:overview:{user_id}'
+
+    @classmethod
+    def clear_overview_cache(cls, user_ids):
+        """
+        Drop the cached transfer_overview counters of the given users,
+        along with the global completed count.
+
+        Deferred until commit, so a concurrent page load can't re-cache the
+        pre-change counts while the write is still uncommitted.
+        """
+        keys = [cls.overview_cache_key(user_id) for user_id in set(user_ids)]
+        keys.append(cls.COMPLETED_CACHE_KEY)
+        transaction.on_commit(lambda: cache.delete_many(keys))
 
     @property
     def is_expired(self):
         """Check if request has expired."""
-        from django.utils import timezone
         if self.status == self.Status.PENDING and self.expires_at:
             return timezone.now() > self.expires_at
         return False
@@ -178,7 +367,6 @@ class TransferRequest(models.Model):
     @property
     def days_until_expiry(self):
         """Get days until expiration (uses extended deadline if available)."""
-        from django.utils import timezone
         if self.status == self.Status.PENDING:
             # Use extended deadline if available, otherwise use original
             deadline = self.expiration_extended_until or self.expires_at
@@ -187,13 +375,15 @@ class TransferRequest(models.Model):
                 return max(0, delta.days)
         return None
 
-    def time_until_expiration(self):
+    def time_until_expiration(self, now=None):
         """
         Get precise time until expiration.
         Returns timedelta or None.
-        """
-        from django.utils import timezone
 
+        Args:
+            now: Reference time (defaults to timezone.now()); pass one value
+                 when evaluating many requests at once
+        """
         if self.status != self.Status.PENDING:
             return None
 
@@ -203,16 +393,17 @@ class TransferRequest(models.Model):
         if not deadline:
             return None
 
-        delta = deadline - timezone.now()
+        delta = deadline - (now or timezone.now())
         return delta if delta.total_seconds() > 0 else None
 
-    def can_expire(self):
+    def can_expire(self, now=None):
         """
         Check if request can be expired.
         Returns True if request is pending and past deadline.
-        """
-        from django.utils import timezone
 
+        Args:
+            now: Reference time (defaults to timezone.now())
+        """
         if self.status != self.Status.PENDING:
             return False
 
@@ -222,7 +413,7 @@ class TransferRequest(models.Model):
         if not deadline:
             return False
 
-        return timezone.now() >= deadline
+        return (now or timezone.now()) >= deadline
 
     @transaction.atomic
     def expire(self, expired_by_user=None):
@@ -238,41 +429,88 @@ class TransferRequest(models.Model):
         Returns:
             bool: True if expired successfully
         """
-        from django.utils import timezone
-
         # Validate
         if self.status != self.Status.PENDING:
-            raise ValidationError(f"Cannot expire request with status {self.get_status_display()}.")
-
-        # Lock the item to prevent race conditions
-        from items.models import Item
-        item = Item.objects.select_for_update().get(pk=self.item.pk)
+            raise ValidationError(f"Cannot expire request with status {self._STATUS_LABELS.get(self.status, self.status)}.")
 
-        # Update request status
-        self.status = self.Status.EXPIRED
-        self.resolved_at = timezone.now()
+        # Update request status (conditional UPDATE, no re-read or row lock)
         if expired_by_user:
-            self.manually_expired_by = expired_by_user
+            self._close_pending(self.Status.EXPIRED, manually_expired_by=expired_by_user)
+        else:
+            self._close_pending(self.Status.EXPIRED)
 
         # Handle item status based on request type
         if self.request_type == self.RequestType.RETURN:
-            # Revert to original status if we have it
-            if self.original_item_status:
-                # Only revert if item status hasn't been manually changed
-                if item.status == 'PENDING_INSPECTION':
-                    item.status = self.original_item_status
-                    item.save()
-            else:
-                # Fallback: revert PENDING_INSPECTION to NORMAL
-                if item.status == 'PENDING_INSPECTION':
-                    item.status = 'NORMAL'
-                    item.save()
+            self._revert_returned_item()
 
         # For ASSIGN requests, just expire without changing item status
 
-        self.save()
         return True
 
+    @classmethod
+    @transaction.atomic
+    def bulk_expire(cls, queryset, expired_by_user=None, now=None):
+        """
+        Expire every pending request in a queryset with set-based UPDATEs.
+
+        Batch counterpart of expire(): same item handling, but one UPDATE
+        for the requests and one for the items (each RETURN item reverted
+        to its request's original status via a correlated subquery) instead
+        of two saves per request. Notifications are left to the caller.
+
+        Args:
+            queryset: TransferRequest queryset to expire (non-pending rows are skipped)
+            expired_by_user: User who manually expired (None for automatic expiration)
+            now: Resolution timestamp (defaults to timezone.now())
+
+        Returns:
+            list: PKs of the requests that were expired
+        """
+        from items.models import Item
+
+        now = now or timezone.now()
+
+        # Lock the selection so a concurrent accept/reject can't slip in;
+        # rows another worker already holds are skipped (that worker is
+        # resolving them), so concurrent sweeps process disjoint sets
+        locked = list(
+            queryset.filter(status=cls.Status.PENDING)
+            .select_for_update(skip_locked=True, of=('self',))
+            .values_list('pk', 'from_user_id', 'to_user_id')
+        )
+        if not locked:
+            return []
+        expired_ids = [pk for pk, _, _ in locked]
+
+        expired = cls.objects.filter(pk__in=expired_ids)
+        expired.update(
+            status=cls.Status.EXPIRED,
+            resolved_at=now,
+            manually_expired_by=expired_by_user,
+            updated_at=now
+        )
+
+        # RETURN requests: revert items still in inspection to their original
+        # status (NORMAL when unknown) in one UPDATE, reading each item's
+        # original status from its request; ASSIGN items are left alone
+        returns = expired.filter(request_type=cls.RequestType.RETURN)
+        original_status = returns.filter(item=OuterRef('pk')).values('original_item_status')[:1]
+        Item.objects.filter(
+            pk__in=returns.values('item_id'),
+            status=Item.Status.PENDING_INSPECTION
+        ).update(
+            status=Coalesce(
+                NullIf(Subquery(original_status), Value('')),
+                Value(Item.Status.NORMAL)
+            ),
+            updated_at=now
+        )
+
+        cls.clear_overview_cache(
+            [from_id for _, from_id, _ in locked] + [to_id for _, _, to_id in locked]
+        )
+        return expired_ids
+
     def extend_expiration(self, days, extended_by_user):
         """
         Extend the expiration deadline.
@@ -284,16 +522,13 @@ class TransferRequest(models.Model):
         Returns:
             bool: True if extended successfully
         """
-        from django.utils import timezone
-        from datetime import timedelta
-
         # Validate permissions
         if not (extended_by_user.is_manager or extended_by_user.is_staff_member):
             raise ValidationError("Only managers and staff can extend expiration deadlines.")
 
         # Validate request is still pending
         if self.status != self.Status.PENDING:
-            raise ValidationError(f"Cannot extend request with status {self.get_status_display()}.")
+            raise ValidationError(f"Cannot extend request with status {self._STATUS_LABELS.get(self.status, self.status)}.")
 
         # Calculate new deadline from current deadline (original or already extended)
         current_deadline = self.expiration_extended_until or self.expires_at
@@ -308,12 +543,15 @@ class TransferRequest(models.Model):
         self.warning_48h_sent = False
         self.warning_24h_sent = False
 
-        self.save()
+        self.save(update_fields=[
+            'expiration_extended_until', 'warning_48h_sent', 'warning_24h_sent', 'updated_at'
+        ])
         return True
 
     def clean(self):
         """Validate transfer request."""
         super().clean()
+        is_return = self.request_type == self.RequestType.RETURN
 
         # Validate item is not inactive
         if self.item and self.item.is_inactive:
@@ -324,7 +562,7 @@ class TransferRequest(models.Model):
 
         # Validate from_user owns the item (only for RETURN requests)
         # For ASSIGN requests, Staff can assign any available item to teachers
-        if self.request_type == self.RequestType.RETURN and self.item and self.from_user_id:
+        if is_return and self.item and self.from_user_id:
             if self.from_user != self.item.current_owner:
                 raise ValidationError(
                     f"User {self.from_user.email} does not own item {self.item.asset_id}. "
@@ -332,7 +570,7 @@ class TransferRequest(models.Model):
                 )
 
         # For returns, validate new_status is required when accepting
-        if self.request_type == self.RequestType.RETURN and self.status == self.Status.ACCEPTED:
+        if is_return and self.status == self.Status.ACCEPTED:
             if not self.new_status:
                 raise ValidationError(
                     "New status is required when accepting a return request."
@@ -349,15 +587,15 @@ class TransferRequest(models.Model):
             new_status: New status for return requests (required for RETURN)
             current_location: Location where item will be kept (required for ASSIGN)
         """
-        from django.utils import timezone
         from items.models import Item
 
         # Validate
         if self.status != self.Status.PENDING:
-            raise ValidationError(f"Cannot accept request that is {self.get_status_display()}.")
+            raise ValidationError(f"Cannot accept request that is {self._STATUS_LABELS.get(self.status, self.status)}.")
 
-        # Validation depends on request type
-        if self.request_type == self.RequestType.RETURN:
+        # Validation depends on request type (checked once, reused below)
+        is_return = self.request_type == self.RequestType.RETURN
+        if is_return:
             # For returns: Any staff member can accept
             if not (accepted_by_user.is_staff_member or accepted_by_user.is_manager):
                 raise ValidationError("Only staff members can accept return requests.")
@@ -372,39 +610,51 @@ class TransferRequest(models.Model):
             if not current_location:
                 raise ValidationError("Current location is required when accepting an assignment.")
 
-        # Update request status
-        self.status = self.Status.ACCEPTED
-        self.resolved_at = timezone.now()
+        # Update request status (conditional UPDATE: a concurrent accept or
+        # reject of the same request makes this raise instead of double-applying)
         if new_status:
-            self.new_status = new_status
-        self.save()
+            self._close_pending(self.Status.ACCEPTED, new_status=new_status)
+        else:
+            self._close_pending(self.Status.ACCEPTED)
 
         # Transfer item ownership
-        old_owner = self.item.current_owner
+        old_owner_id = self.item.current_owner_id
 
         # For returns, item goes to whoever accepted it (any staff)
         # For assigns, item goes to the assigned user (to_user)
-        if self.request_type == self.RequestType.RETURN:
+        if is_return:
             transfer_target = accepted_by_user
         else:
             transfer_target = self.to_user
 
-        self.item.current_owner = transfer_target
+        # Same rule Item.clean() enforces on save: an inactive item can't change hands
+        inactive_statuses = (Item.Status.REPAIR, Item.Status.LOST, Item.Status.REMOVED)
+        if new_status in inactive_statuses and old_owner_id != transfer_target.pk:
+            raise ValidationError(
+                f"Cannot transfer item with status '{Item.Status(new_status).label}'. "
+                f"Only items with status Normal, Damaged, or Pending Inspection can be transferred."
+            )
+
+        item_updates = {'current_owner': transfer_target, 'updated_at': self.resolved_at}
 
         # Update item status if provided (for returns)
         if new_status:
-            self.item.status = new_status
+            item_updates['status'] = new_status
 
         # Update item current_location if provided (for assigns)
         if current_location:
-            self.item.current_location = current_location
+            item_updates['current_location'] = current_location
 
-        self.item.save()
+        # One UPDATE of just the changed columns instead of reloading and
+        # re-validating the whole item row; keep the loaded instance in sync
+        Item.objects.filter(pk=self.item_id).update(**item_updates)
+        for field, value in item_updates.items():
+            setattr(self.item, field, value)
 
         # Create transfer log
         TransferLog.objects.create(
-            item=self.item,
-            from_user=old_owner,
+            item_id=self.item_id,
+            from_user_id=old_owner_id,
             to_user=transfer_target,
             request=self,
             notes=self.notes or ''
@@ -412,20 +662,71 @@ class TransferRequest(models.Model):
 
         return True
 
+    def _close_pending(self, status, reason=None, **fields):
+        """
+        Move a pending request to a final status in one conditional UPDATE.
+
+        The reason is appended to notes in SQL as "[STATUS] reason", so the
+        existing notes text never has to be read. The WHERE status=PENDING
+        clause guards against a concurrent resolution.
+
+        Args:
+            status: Final status (ACCEPTED, REJECTED, CANCELLED or EXPIRED)
+            reason: Optional reason to append to the notes
+            **fields: Extra plain field values to set in the same UPDATE
+        """
+        now = timezone.now()
+        updates = {**fields, 'status': status, 'resolved_at': now, 'updated_at': now}
+        if reason:
+            entry = f"[{status}] {reason}"
+            updates['notes'] = Case(
+                When(Q(notes__isnull=True) | Q(notes=''), then=Value(entry)),
+                default=Concat(F('notes'), Value(f"\n{entry}")),
+                output_field=TextField()
+            )
+
+        if not type(self).objects.filter(pk=self.pk, status=self.Status.PENDING).update(**updates):
+            raise ValidationError("Cannot update request that is no longer pending.")
+        self.clear_overview_cache([self.from_user_id, self.to_user_id])
+
+        for name, value in fields.items():
+            setattr(self, name, value)
+        self.status = status
+        self.resolved_at = now
+        # Mirror the new notes onto the instance when they were loaded
+        if reason and 'notes' not in self.get_deferred_fields():
+            self.notes = f"{self.notes or ''}\n{entry}".strip()
+
+    def _revert_returned_item(self):
+        """
+        Revert a RETURN request's item out of PENDING_INSPECTION.
+
+        One conditional UPDATE to the original status (NORMAL when unknown);
+        no row matches if someone changed the item status meanwhile. A loaded
+        item instance is kept in sync.
+        """
+        from items.models import Item
+
+        reverted_status = self.original_item_status or Item.Status.NORMAL
+        reverted = Item.objects.filter(
+            pk=self.item_id, status=Item.Status.PENDING_INSPECTION
+        ).update(status=reverted_status, updated_at=self.resolved_at)
+        if reverted and self._meta.get_field('item').is_cached(self):
+            self.item.status = reverted_status
+
     @transaction.atomic
     def reject(self, rejected_by_user, reason=None):
         """
         Reject the transfer request.
         Reverts item to original state.
         """
-        from django.utils import timezone
-
         # Validate
         if self.status != self.Status.PENDING:
-            raise ValidationError(f"Cannot reject request that is {self.get_status_display()}.")
+            raise ValidationError(f"Cannot reject request that is {self._STATUS_LABELS.get(self.status, self.status)}.")
 
-        # Validation depends on request type
-        if self.request_type == self.RequestType.RETURN:
+        # Validation depends on request type (checked once, reused below)
+        is_return = self.request_type == self.RequestType.RETURN
+        if is_return:
             # For returns: Any staff member can reject
             if not (rejected_by_user.is_staff_member or rejected_by_user.is_manager):
                 raise ValidationError("Only staff members can reject return requests.")
@@ -435,18 +736,11 @@ class TransferRequest(models.Model):
                 raise ValidationError(f"Only {self.to_user.email} can reject this request.")
 
         # Update request status
-        self.status = self.Status.REJECTED
-        self.resolved_at = timezone.now()
-        if reason:
-            self.notes = f"{self.notes or ''}\n[REJECTED] {reason}".strip()
-        self.save()
+        self._close_pending(self.Status.REJECTED, reason)
 
-        # For returns, revert item status back to NORMAL (or original)
-        if self.request_type == self.RequestType.RETURN:
-            # If item was set to PENDING_INSPECTION, revert to NORMAL
-            if self.item.status == 'PENDING_INSPECTION':
-                self.item.status = 'NORMAL'
-                self.item.save()
+        # For returns, revert item status back to original (or NORMAL)
+        if is_return:
+            self._revert_returned_item()
 
         return True
 
@@ -463,11 +757,9 @@ class TransferRequest(models.Model):
         Returns:
             bool: True if cancelled successfully
         """
-        from django.utils import timezone
-
         # Validate
         if self.status != self.Status.PENDING:
-            raise ValidationError(f"Cannot cancel request that is {self.get_status_display()}.")
+            raise ValidationError(f"Cannot cancel request that is {self._STATUS_LABELS.get(self.status, self.status)}.")
 
         # Validate permissions - must be staff/manager
         if not (cancelled_by_user.is_staff_member or cancelled_by_user.is_manager):
@@ -478,21 +770,11 @@ class TransferRequest(models.Model):
             raise ValidationError("You can only cancel requests you are involved in.")
 
         # Update request status
-        self.status = self.Status.CANCELLED
-        self.resolved_at = timezone.now()
-        if reason:
-            self.notes = f"{self.notes or ''}\n[CANCELLED] {reason}".strip()
-        self.save()
+        self._close_pending(self.Status.CANCELLED, reason)
 
-        # For RETURN requests, revert item status if it was set to PENDING_INSPECTION
+        # For RETURN requests, revert item status if it is still PENDING_INSPECTION
         if self.request_type == self.RequestType.RETURN:
-            if self.item.status == 'PENDING_INSPECTION':
-                # Revert to original status if we have it
-                if self.original_item_status:
-                    self.item.status = self.original_item_status
-                else:
-                    self.item.status = 'NORMAL'
-                self.item.save()
+            self._revert_returned_item()
 
         return True
 
@@ -542,6 +824,12 @@ class TransferLog(models.Model):
         help_text='True if this was a forced transfer by Admin'
     )
 
+    objects = TransferLogQuerySet.as_manager()
+
+    # Shared (not per-user) recent-activity list on transfer_overview;
+    # cleared whenever a log is written
+    RECENT_CACHE_KEY = 'transfers:overview:recent_logs'
+
     class Meta:
         verbose_name = 'Transfer Log'
         verbose_name_plural = 'Transfer Logs'
@@ -556,8 +844,38 @@ class TransferLog(models.Model):
         forced = " [FORCED]" if self.is_forced else ""
         return f"{self.item.asset_id}: {self.from_user.email} → {self.to_user.email}{forced} ({self.transferred_at.strftime('%Y-%m-%d')})"
 
+    @classmethod
+    def bulk_log(cls, rows):
+        """
+        Create many transfer logs in batched INSERTs.
+
+        Used by batch flows (forced and bulk transfers) instead of one
+        objects.create() per item. New rows have no pk, so skipping the
+        save() override loses nothing.
+
+        Args:
+            rows: Iterable of dicts of TransferLog field values
+
+        Returns:
+            list: The created TransferLog instances
+        """
+        created = cls.objects.bulk_create([cls(**row) for row in rows], batch_size=500)
+        cls.clear_recent_cache()
+        return created
+
+    @classmethod
+    def clear_recent_cache(cls):
+        """Drop the cached recent-activity list of transfer_overview (on commit)."""
+        transaction.on_commit(lambda: cache.delete(cls.RECENT_CACHE_KEY))
+
     def save(self, *args, **kwargs):
-        """Override save to make logs immutable after creation."""
-        if self.pk:
+        """
+        Override save to make logs immutable after creation.
+
+        On PostgreSQL a BEFORE UPDATE trigger (migrations 0012, 0016) enforces this
+        in the database, so the check only runs on other backends.
+        """
+        if self.pk and connection.vendor != 'postgresql':
             raise ValidationError("Transfer logs cannot be modified after creation.")
         super().save(*args, **kwargs)
+        self.clear_recent_cache()
@@ -8,13 +8,15 @@ Handles automatic request expiration with dual warning system:
 """
 
 from celery import shared_task
+from django.db import DatabaseError
 from django.utils import timezone
-from django.db import transaction
-from datetime import timedelta
 import logging
 
 from .models import TransferRequest
-from notifications.utils import notify_request_expiring_soon, notify_request_expired
+from notifications.utils import (
+    create_notifications, notify_request_expired, notify_request_expiring_soon,
+    send_bulk_notification_emails
+)
 
 logger = logging.getLogger(__name__)
 
@@ -41,89 +43,78 @@ def check_expiring_requests():
         'errors': 0
     }
 
-    # Get all pending requests
-    pending_requests = TransferRequest.objects.filter(
-        status=TransferRequest.Status.PENDING
-    ).select_related('item', 'to_user', 'from_user')
+    # In-app notifications and emails are collected while the database work
+    # runs, then inserted in bulk and sent over one SMTP connection at the end
+    emails = []
+    notifications = []
 
-    for request in pending_requests:
-        try:
-            # Determine effective deadline (extended or original)
-            deadline = request.expiration_extended_until or request.expires_at
-
-            if not deadline:
-                continue
-
-            time_until_expiry = deadline - now
-            hours_remaining = time_until_expiry.total_seconds() / 3600
-
-            # Check if request should be expired
-            if hours_remaining <= 0:
-                _expire_request(request)
-                stats['expired'] += 1
-
-            # Send 24-hour warning (if between 24-25 hours remaining and not sent)
-            elif 24 <= hours_remaining < 25 and not request.warning_24h_sent:
-                notify_request_expiring_soon(request, hours_remaining=24)
-                request.warning_24h_sent = True
-                request.save(update_fields=['warning_24h_sent', 'updated_at'])
-                stats['warnings_24h'] += 1
-                logger.info(f"Sent 24h warning for request {request.pk}")
-
-            # Send 48-hour warning (if between 48-49 hours remaining and not sent)
-            elif 48 <= hours_remaining < 49 and not request.warning_48h_sent:
-                notify_request_expiring_soon(request, hours_remaining=48)
-                request.warning_48h_sent = True
-                request.save(update_fields=['warning_48h_sent', 'updated_at'])
-                stats['warnings_48h'] += 1
-                logger.info(f"Sent 48h warning for request {request.pk}")
-
-        except Exception as e:
-            stats['errors'] += 1
-            logger.error(f"Error processing request {request.pk}: {str(e)}")
-            continue
-
-    result_msg = (
-        f"Expiration check complete: "
-        f"{stats['warnings_48h']} 48h warnings, "
-        f"{stats['warnings_24h']} 24h warnings, "
-        f"{stats['expired']} expired, "
-        f"{stats['errors']} errors"
-    )
-    logger.info(result_msg)
-
-    return result_msg
-
-
-@transaction.atomic
-def _expire_request(request):
-    """
-    Helper function to expire a single request with race condition protection.
+    # Both bucket queries filter status='PENDING' on the coalesced deadline,
+    # which is exactly the shape of the partial indexes on TransferRequest
+    # (transfers_pending_deadline_idx / transfers_pending_warn24|48_idx)
 
-    Uses select_for_update() to lock the request and item during expiration.
-
-    Args:
-        request: TransferRequest instance to expire
-    """
-    # Lock request to prevent concurrent modification
-    locked_request = TransferRequest.objects.select_for_update().get(pk=request.pk)
-
-    # Double-check status (race condition protection)
-    if locked_request.status != TransferRequest.Status.PENDING:
-        logger.warning(f"Request {request.pk} already resolved, skipping expiration")
-        return
-
-    # Use the model's expire() method which handles all logic
+    # Expired: effective deadline (extended or original) already passed.
+    # bulk_expire() locks and expires them with set-based UPDATEs (item
+    # reverts included) in its own transaction, so a database error rolls
+    # back just that step and the warnings below still go out. Anything
+    # else propagates to Celery's failure tracking
     try:
-        locked_request.expire(expired_by_user=None)
+        expired_ids = TransferRequest.bulk_expire(
+            TransferRequest.objects.pending_expired(), now=now
+        )
+    except DatabaseError:
+        expired_ids = []
+        stats['errors'] += 1
+        logger.exception("Error expiring requests")
 
-        # Send notifications
-        notify_request_expired(locked_request)
+    # The per-request steps below only build notifications/emails in memory
+    # (no database writes), so a failure there just skips that request
 
+    # Rows are streamed in chunks so a large backlog doesn't sit in memory
+    expired = TransferRequest.objects.filter(pk__in=expired_ids).with_related()
+    for request in expired.iterator(chunk_size=500):
+        try:
+            notify_request_expired(request, emails=emails, notifications=notifications)
+            logger.info(
+                "Expired request %s: %s for %s",
+                request.pk, request.get_request_type_display(), request.item.asset_id
+            )
+        except Exception as e:
+            stats['errors'] += 1
+            logger.error("Error notifying expired request %s: %s", request.pk, e)
+    stats['expired'] = len(expired_ids)
+
+    # Warnings: same 24-25 / 48-49 hour windows as before, selected in SQL;
+    # notify each request, then set the window's flag in one UPDATE
+    for hours in (24, 48):
+        warned_ids = []
+        due = TransferRequest.objects.due_for_warning(hours, now)
+        for request in due.iterator(chunk_size=500):
+            try:
+                notify_request_expiring_soon(
+                    request, hours_remaining=hours, emails=emails, notifications=notifications
+                )
+                warned_ids.append(request.pk)
+                logger.info("Sent %sh warning for request %s", hours, request.pk)
+            except Exception as e:
+                stats['errors'] += 1
+                logger.error("Error processing request %s: %s", request.pk, e)
+
+        if warned_ids:
+            TransferRequest.objects.filter(pk__in=warned_ids).update(
+                **{f'warning_{hours}h_sent': True, 'updated_at': now}
+            )
+        stats[f'warnings_{hours}h'] = len(warned_ids)
+
+    create_notifications(notifications)
+    send_bulk_notification_emails(emails)
+
+    # Plain dict for the result backend; the summary line is only built
+    # when INFO is actually enabled
+    if logger.isEnabledFor(logging.INFO):
         logger.info(
-            f"Expired request {locked_request.pk}: "
-            f"{locked_request.get_request_type_display()} for {locked_request.item.asset_id}"
+            "Expiration check complete: %s 48h warnings, %s 24h warnings, "
+            "%s expired, %s errors",
+            stats['warnings_48h'], stats['warnings_24h'], stats['expired'], stats['errors']
         )
-    except Exception as e:
-        logger.error(f"Error expiring request {request.pk}: {str(e)}")
-        raise
+
+    return stats
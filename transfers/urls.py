@@ -18,4 +18,5 @@ urlpatterns = [
     path('<int:pk>/edit/', views.edit_request, name='edit_request'),
     path('<int:pk>/extend/', views.extend_request, name='extend_request'),
     path('history/', views.transfer_history, name='transfer_history'),
+    path('history/export/', views.transfer_history_export, name='transfer_history_export'),
 ]
@@ -2,46 +2,70 @@
 Transfer workflow views.
 """
 
+import csv
+
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 
 from users.decorators import staff_required, member_or_staff_required
+from users.models import User
 from .models import TransferRequest, TransferLog
-from .forms import TransferRequestForm, ReturnRequestForm, AcceptReturnForm, AcceptTransferForm, RejectRequestForm
+from .forms import (
+    TransferRequestForm, ReturnRequestForm, AcceptReturnForm, AcceptTransferForm,
+    RejectRequestForm, CancelRequestForm, EditTransferRequestForm, ExtendRequestForm
+)
 from items.models import Item
 from django.db.models import Count, Q
-from notifications.utils import notify_new_request, notify_request_accepted, notify_request_rejected
+from notifications.tasks import (
+    queue_notification, send_new_request_notification, send_request_accepted_notification,
+    send_request_rejected_notification, send_request_cancelled_notification,
+    send_request_updated_notification, send_request_extended_notification
+)
 
 
 @member_or_staff_required
 def transfer_overview(request):
     """Transfer overview page with statistics."""
 
-    # Count pending requests
-    pending_to_accept = TransferRequest.objects.filter(
-        to_user=request.user,
-        status='PENDING'
-    ).count()
-
-    pending_sent = TransferRequest.objects.filter(
-        from_user=request.user,
-        status='PENDING'
-    ).count()
-
-    # Count total transfers
-    total_completed = TransferRequest.objects.filter(
-        status='ACCEPTED'
-    ).count()
-
-    # Recent activity
-    recent_logs = TransferLog.objects.select_related(
-        'item', 'from_user', 'to_user'
-    ).order_by('-transferred_at')[:10]
+    # Count the user's pending requests in one aggregate query, cached
+    # briefly per user (cleared when one of their requests changes)
+    counts = cache.get_or_set(
+        TransferRequest.overview_cache_key(request.user.pk),
+        lambda: TransferRequest.objects.aggregate(
+            pending_to_accept=Count('pk', filter=Q(to_user=request.user, status='PENDING')),
+            pending_sent=Count('pk', filter=Q(from_user=request.user, status='PENDING')),
+        ),
+        timeout=TransferRequest.OVERVIEW_CACHE_TIMEOUT
+    )
+
+    # Completed transfers across all users, cached once for everyone
+    # (cleared whenever any request changes)
+    total_completed = cache.get_or_set(
+        TransferRequest.COMPLETED_CACHE_KEY,
+        lambda: TransferRequest.objects.filter(status='ACCEPTED').count(),
+        timeout=TransferRequest.OVERVIEW_CACHE_TIMEOUT
+    )
+
+    # Recent activity (same for every user, cleared when a log is written)
+    recent_logs = cache.get_or_set(
+        TransferLog.RECENT_CACHE_KEY,
+        lambda: list(
+            TransferLog.objects.with_related().only(
+                'transferred_at', 'is_forced',
+                'item__name', 'from_user__email', 'to_user__email'
+            ).order_by('-transferred_at')[:10]
+        ),
+        timeout=TransferRequest.OVERVIEW_CACHE_TIMEOUT
+    )
 
     context = {
-        'pending_to_accept': pending_to_accept,
-        'pending_sent': pending_sent,
+        'pending_to_accept': counts['pending_to_accept'],
+        'pending_sent': counts['pending_sent'],
         'total_completed': total_completed,
         'recent_logs': recent_logs,
     }
@@ -57,22 +81,31 @@ def create_transfer_request(request):
         if form.is_valid():
             item = form.cleaned_data['item']
 
-            # FR-2.4: Validate item status - cannot transfer inactive items
-            if item.status in ['REPAIR', 'LOST', 'REMOVED']:
-                messages.error(
-                    request,
-                    f"Cannot transfer item {item.asset_id}. "
-                    f"Items with status '{item.get_status_display()}' cannot be transferred."
-                )
-                return redirect('items:item_detail', pk=item.pk)
-
-            # Check if item already has a pending transfer request
-            existing_pending = TransferRequest.objects.filter(
-                item=item,
-                status='PENDING'
-            ).exists()
+            transfer = form.save(commit=False)
+            transfer.from_user = request.user
+            transfer.request_type = 'ASSIGN'
 
-            if existing_pending:
+            try:
+                with transaction.atomic():
+                    # Lock the item row and re-read its status so it can't turn
+                    # inactive between this check and the insert below
+                    item.status = Item.objects.select_for_update().values_list(
+                        'status', flat=True
+                    ).get(pk=item.pk)
+
+                    # FR-2.4: Validate item status - cannot transfer inactive items
+                    if item.status in ['REPAIR', 'LOST', 'REMOVED']:
+                        messages.error(
+                            request,
+                            f"Cannot transfer item {item.asset_id}. "
+                            f"Items with status '{item.get_status_display()}' cannot be transferred."
+                        )
+                        return redirect('items:item_detail', pk=item.pk)
+
+                    # The partial unique index rejects a second pending request
+                    # for the same item, so no existence check is needed
+                    transfer.save()
+            except IntegrityError:
                 messages.error(
                     request,
                     f"Cannot create transfer request. Item {item.asset_id} already has a pending transfer request. "
@@ -80,13 +113,11 @@ def create_transfer_request(request):
                 )
                 return redirect('transfers:create_transfer')
 
-            transfer = form.save(commit=False)
-            transfer.from_user = request.user
-            transfer.request_type = 'ASSIGN'
-            transfer.save()
-
-            # Send notification to recipient
-            notify_new_request(transfer)
+            # Send notification to recipient (on a worker, once committed)
+            transaction.on_commit(
+                lambda: queue_notification(send_new_request_notification, transfer.pk),
+                robust=True
+            )
 
             messages.success(
                 request,
@@ -116,28 +147,49 @@ def create_return_request(request, item_id):
     if request.method == 'POST':
         form = ReturnRequestForm(request.POST)
         if form.is_valid():
-            # Find a staff member to return to
-            from users.models import User
-            staff_users = User.objects.filter(role__in=['STAFF', 'MANAGER'], is_active=True)
-            if not staff_users.exists():
+            # Find a staff member to return to: the one with the fewest
+            # pending returns (lowest pk on ties), in one grouped query
+            staff_id = User.objects.filter(
+                role__in=['STAFF', 'MANAGER'], is_active=True
+            ).annotate(
+                pending_returns=Count('transfer_requests_received', filter=Q(
+                    transfer_requests_received__status='PENDING',
+                    transfer_requests_received__request_type='RETURN'
+                ))
+            ).order_by('pending_returns', 'pk').values_list('pk', flat=True).first()
+            if staff_id is None:
                 messages.error(request, "No staff members available to receive return.")
                 return redirect('items:item_detail', pk=item_id)
 
-            # Create return request to first available staff
-            transfer = TransferRequest.objects.create(
-                request_type='RETURN',
-                from_user=request.user,
-                to_user=staff_users.first(),
-                item=item,
-                notes=form.cleaned_data.get('notes', '')
-            )
+            # Create return request to that staff member
+            # (the partial unique index rejects a second pending request)
+            try:
+                with transaction.atomic():
+                    transfer = TransferRequest.objects.create(
+                        request_type='RETURN',
+                        from_user=request.user,
+                        to_user_id=staff_id,
+                        item=item,
+                        notes=form.cleaned_data.get('notes', '')
+                    )
 
-            # Send notification to staff
-            notify_new_request(transfer)
+                    # Set item status to pending inspection (status-only UPDATE,
+                    # committed together with the request)
+                    Item.objects.filter(pk=item.pk).update(
+                        status='PENDING_INSPECTION', updated_at=timezone.now()
+                    )
+            except IntegrityError:
+                messages.error(
+                    request,
+                    f"Item {item.asset_id} already has a pending transfer request."
+                )
+                return redirect('items:item_detail', pk=item_id)
 
-            # Set item status to pending inspection
-            item.status = 'PENDING_INSPECTION'
-            item.save()
+            # Send notification to staff (on a worker, once committed)
+            transaction.on_commit(
+                lambda: queue_notification(send_new_request_notification, transfer.pk),
+                robust=True
+            )
 
             messages.success(
                 request,
@@ -163,24 +215,42 @@ def pending_requests(request):
     # For STAFF/MANAGER: Show ALL pending RETURN requests (any staff can accept returns)
     #                    + ASSIGN requests specifically sent to them
     # For MEMBERS: Show only requests sent to them
+    # Only the columns the template shows are loaded (days_until_expiry
+    # needs status and both deadlines); both UNION sides share the same list
+    list_fields = (
+        'request_type', 'status', 'notes', 'created_at',
+        'expires_at', 'expiration_extended_until',
+        'item__asset_id', 'item__name', 'item__status',
+    )
     if request.user.is_staff_or_admin:
-        # Staff can see all RETURN requests OR ASSIGN requests sent to them
-        requests_to_accept = TransferRequest.objects.filter(
-            Q(request_type='RETURN', status='PENDING') |  # All pending returns
-            Q(to_user=request.user, request_type='ASSIGN', status='PENDING')  # Assigns to me
-        ).select_related('item', 'from_user').order_by('-created_at')
+        # Staff can see all RETURN requests plus ASSIGN requests sent to them.
+        # The two sets are disjoint, so each side runs against its own index
+        # and is combined with UNION ALL instead of an OR across columns
+        pending_returns = TransferRequest.objects.filter(
+            request_type='RETURN', status='PENDING'
+        ).select_related('item', 'from_user').only(*list_fields, 'from_user__email').order_by()
+        assigns_to_me = TransferRequest.objects.filter(
+            to_user=request.user, request_type='ASSIGN', status='PENDING'
+        ).select_related('item', 'from_user').only(*list_fields, 'from_user__email').order_by()
+        requests_to_accept = pending_returns.union(
+            assigns_to_me, all=True
+        ).order_by('-created_at')
     else:
         # Members only see requests sent to them
         requests_to_accept = TransferRequest.objects.filter(
             to_user=request.user,
             status='PENDING'
-        ).select_related('item', 'from_user').order_by('-created_at')
+        ).select_related('item', 'from_user').only(
+            *list_fields, 'from_user__email'
+        ).order_by('-created_at')
 
     # Requests I sent (waiting for others)
     requests_sent = TransferRequest.objects.filter(
         from_user=request.user,
         status='PENDING'
-    ).select_related('item', 'to_user').order_by('-created_at')
+    ).select_related('item', 'to_user').only(
+        *list_fields, 'to_user__email'
+    ).order_by('-created_at')
 
     context = {
         'requests_to_accept': requests_to_accept,
@@ -193,7 +263,7 @@ def pending_requests(request):
 @member_or_staff_required
 def accept_request(request, pk):
     """Accept a transfer request."""
-    transfer = get_object_or_404(TransferRequest, pk=pk)
+    transfer = get_object_or_404(TransferRequest.objects.with_related(), pk=pk)
 
     # Verify user can accept this request
     # For RETURN requests: Any staff member can accept
@@ -220,8 +290,11 @@ def accept_request(request, pk):
                 try:
                     transfer.accept(request.user, new_status=new_status)
 
-                    # Send notification to requester
-                    notify_request_accepted(transfer)
+                    # Send notification to requester (on a worker, once committed)
+                    transaction.on_commit(
+                        lambda: queue_notification(send_request_accepted_notification, transfer.pk),
+                        robust=True
+                    )
 
                     messages.success(
                         request,
@@ -247,8 +320,11 @@ def accept_request(request, pk):
             try:
                 transfer.accept(request.user, current_location=current_location)
 
-                # Send notification to requester
-                notify_request_accepted(transfer)
+                # Send notification to requester (on a worker, once committed)
+                transaction.on_commit(
+                    lambda: queue_notification(send_request_accepted_notification, transfer.pk),
+                    robust=True
+                )
 
                 messages.success(
                     request,
@@ -270,7 +346,7 @@ def accept_request(request, pk):
 @member_or_staff_required
 def reject_request(request, pk):
     """Reject a transfer request."""
-    transfer = get_object_or_404(TransferRequest, pk=pk)
+    transfer = get_object_or_404(TransferRequest.objects.with_related(), pk=pk)
 
     # Verify user can reject this request
     # For RETURN requests: Any staff member can reject
@@ -295,8 +371,11 @@ def reject_request(request, pk):
             try:
                 transfer.reject(request.user, reason=reason)
 
-                # Send notification to requester
-                notify_request_rejected(transfer, reason)
+                # Send notification to requester (on a worker, once committed)
+                transaction.on_commit(
+                    lambda: queue_notification(send_request_rejected_notification, transfer.pk, reason),
+                    robust=True
+                )
 
                 messages.success(
                     request,
@@ -319,24 +398,66 @@ def reject_request(request, pk):
 @staff_required
 def transfer_history(request):
     """View transfer history (Staff/Manager only)."""
-    from .models import TransferLog
-
-    # Get all transfer logs
-    logs = TransferLog.objects.all().select_related(
-        'item', 'from_user', 'to_user'
-    ).order_by('-transferred_at')
+    # 100 most recent transfer logs, loading only the displayed columns
+    # (the joined item/user rows would otherwise come back in full)
+    logs = TransferLog.objects.with_related().only(
+        'transferred_at', 'is_forced',
+        'item__asset_id', 'item__name',
+        'from_user__email', 'to_user__email'
+    ).order_by('-transferred_at')[:100]
 
     context = {
-        'logs': logs[:100],  # Limit to 100 most recent
+        'logs': logs,
     }
 
     return render(request, 'transfers/transfer_history.html', context)
 
 
+class _Echo:
+    """File-like object whose write() just returns the line, for csv.writer."""
+
+    def write(self, value):
+        return value
+
+
+# Leading characters spreadsheet apps treat as the start of a formula
+_CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def _csv_safe(value):
+    """Quote user-entered text so Excel/Sheets won't evaluate it as a formula."""
+    if isinstance(value, str) and value.startswith(_CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+@staff_required
+def transfer_history_export(request):
+    """Download the full transfer history as CSV (Staff/Manager only)."""
+    # Plain tuples streamed in chunks, so memory stays flat however long
+    # the history gets (no model instances or full result list)
+    rows = TransferLog.objects.order_by('-transferred_at').values_list(
+        'transferred_at', 'item__asset_id', 'item__name',
+        'from_user__email', 'to_user__email', 'is_forced', 'notes'
+    ).iterator(chunk_size=500)
+
+    writer = csv.writer(_Echo())
+    header = ['transferred_at', 'asset_id', 'item', 'from', 'to', 'forced', 'notes']
+
+    def stream():
+        yield writer.writerow(header)
+        for transferred_at, *rest in rows:
+            yield writer.writerow([transferred_at.isoformat(), *map(_csv_safe, rest)])
+
+    response = StreamingHttpResponse(stream(), content_type='text/csv')
+    response['Content-Disposition'] = 'attachment; filename="transfer_history.csv"'
+    return response
+
+
 @staff_required
 def cancel_request(request, pk):
     """Cancel a pending transfer request (Staff/Manager only)."""
-    transfer = get_object_or_404(TransferRequest, pk=pk)
+    transfer = get_object_or_404(TransferRequest.objects.with_related(), pk=pk)
 
     # Verify user can cancel this request
     # Must be staff/manager and involved in the request (sender or receiver)
@@ -349,22 +470,18 @@ def cancel_request(request, pk):
         return redirect('transfers:pending_requests')
 
     if request.method == 'POST':
-        from .forms import CancelRequestForm
         form = CancelRequestForm(request.POST)
         if form.is_valid():
             reason = form.cleaned_data.get('reason', '')
             try:
                 transfer.cancel(request.user, reason=reason)
 
-                # Send notification to the other party
-                from notifications.models import Notification
-                other_user = transfer.to_user if transfer.from_user == request.user else transfer.from_user
-                Notification.objects.create(
-                    recipient=other_user,
-                    notification_type='REQUEST_EXPIRED',  # Reuse EXPIRED type for cancelled
-                    title='Transfer Request Cancelled',
-                    message=f'{request.user.get_full_name() or request.user.email} cancelled a transfer request for {transfer.item.name}. {reason if reason else ""}',
-                    related_request=transfer
+                # Notify the other party once the cancellation is committed
+                transaction.on_commit(
+                    lambda: queue_notification(
+                        send_request_cancelled_notification, transfer.pk, request.user.pk, reason
+                    ),
+                    robust=True
                 )
 
                 messages.success(
@@ -376,7 +493,6 @@ def cancel_request(request, pk):
                 messages.error(request, str(e))
                 return redirect('transfers:pending_requests')
     else:
-        from .forms import CancelRequestForm
         form = CancelRequestForm()
 
     context = {
@@ -389,7 +505,7 @@ def cancel_request(request, pk):
 @staff_required
 def edit_request(request, pk):
     """Edit a pending transfer request (Staff/Manager only, requests sent by user)."""
-    transfer = get_object_or_404(TransferRequest, pk=pk)
+    transfer = get_object_or_404(TransferRequest.objects.with_related(), pk=pk)
 
     # Verify user can edit this request
     # Can only edit requests they sent
@@ -402,20 +518,25 @@ def edit_request(request, pk):
         return redirect('transfers:pending_requests')
 
     if request.method == 'POST':
-        from .forms import EditTransferRequestForm
         form = EditTransferRequestForm(request.POST, instance=transfer, request_user=request.user)
         if form.is_valid():
             try:
-                form.save()
-
-                # Send notification about the change
-                from notifications.models import Notification
-                Notification.objects.create(
-                    recipient=transfer.to_user,
-                    notification_type='REQUEST_UPDATED',
-                    title='Transfer Request Updated',
-                    message=f'{request.user.get_full_name() or request.user.email} updated a transfer request for {transfer.item.name}.',
-                    related_request=transfer
+                # The partial unique index rejects moving this request onto an
+                # item that already has a pending request (the form can't
+                # validate it: status isn't one of its fields)
+                with transaction.atomic():
+                    form.save()
+            except IntegrityError:
+                form.add_error('item', "This item already has a pending transfer request.")
+            except ValidationError as e:
+                messages.error(request, str(e))
+            else:
+                # Notify the recipient about the change once it is committed
+                transaction.on_commit(
+                    lambda: queue_notification(
+                        send_request_updated_notification, transfer.pk, request.user.pk
+                    ),
+                    robust=True
                 )
 
                 messages.success(
@@ -423,10 +544,7 @@ def edit_request(request, pk):
                     f"Request updated successfully. {transfer.to_user.email} has been notified."
                 )
                 return redirect('transfers:pending_requests')
-            except ValidationError as e:
-                messages.error(request, str(e))
     else:
-        from .forms import EditTransferRequestForm
         form = EditTransferRequestForm(instance=transfer, request_user=request.user)
 
     context = {
@@ -439,7 +557,7 @@ def edit_request(request, pk):
 @staff_required
 def extend_request(request, pk):
     """Extend a pending transfer request deadline (Staff/Manager only)."""
-    transfer = get_object_or_404(TransferRequest, pk=pk)
+    transfer = get_object_or_404(TransferRequest.objects.with_related(), pk=pk)
 
     # Verify user can extend this request
     # Can extend requests in both "Action Required" and "Requests Sent"
@@ -452,7 +570,6 @@ def extend_request(request, pk):
         return redirect('transfers:pending_requests')
 
     if request.method == 'POST':
-        from .forms import ExtendRequestForm
         form = ExtendRequestForm(request.POST)
         if form.is_valid():
             days = form.cleaned_data['days']
@@ -460,15 +577,13 @@ def extend_request(request, pk):
             try:
                 transfer.extend_expiration(days, request.user)
 
-                # Send notification about the extension
-                from notifications.models import Notification
+                # Notify the other party once the extension is committed
                 other_user = transfer.to_user if transfer.from_user == request.user else transfer.from_user
-                Notification.objects.create(
-                    recipient=other_user,
-                    notification_type='REQUEST_EXTENDED',
-                    title='Transfer Request Deadline Extended',
-                    message=f'{request.user.get_full_name() or request.user.email} extended the deadline for {transfer.item.name} by {days} days. {notes if notes else ""}',
-                    related_request=transfer
+                transaction.on_commit(
+                    lambda: queue_notification(
+                        send_request_extended_notification, transfer.pk, request.user.pk, days, notes
+                    ),
+                    robust=True
                 )
 
                 messages.success(
@@ -479,7 +594,6 @@ def extend_request(request, pk):
             except ValidationError as e:
                 messages.error(request, str(e))
     else:
-        from .forms import ExtendRequestForm
         form = ExtendRequestForm()
 
     context = {
@@ -45,12 +45,34 @@ class PreRegisteredSocialAccountAdapter(DefaultSocialAccountAdapter):
     Allows signup via OAuth - new users created with MEMBER role.
     """
 
+    def _get_email(self, sociallogin):
+        """Primary email of the social login (None if the provider sent none)."""
+        if not hasattr(sociallogin, '_cached_email'):
+            sociallogin._cached_email = (
+                sociallogin.email_addresses[0].email if sociallogin.email_addresses else None
+            )
+        return sociallogin._cached_email
+
+    def _get_existing_user(self, sociallogin):
+        """
+        Existing user with the social login's email, or None.
+
+        Cached on the sociallogin, so the hooks of one login flow share a
+        single lookup instead of each querying by email.
+        """
+        if not hasattr(sociallogin, '_cached_user'):
+            email = self._get_email(sociallogin)
+            sociallogin._cached_user = (
+                User.objects.filter(email=email).first() if email else None
+            )
+        return sociallogin._cached_user
+
     def is_open_for_signup(self, request, sociallogin):
         """
         Allow OAuth signup for all users.
         New OAuth users will be created with MEMBER role.
         """
-        email = sociallogin.email_addresses[0].email if sociallogin.email_addresses else None
+        email = self._get_email(sociallogin)
 
         if not email:
             return False
@@ -62,7 +84,7 @@ class PreRegisteredSocialAccountAdapter(DefaultSocialAccountAdapter):
         """
         Invoked before social login. Check if user is active.
         """
-        email = sociallogin.email_addresses[0].email if sociallogin.email_addresses else None
+        email = self._get_email(sociallogin)
 
         if not email:
             messages.error(
@@ -71,22 +93,16 @@ class PreRegisteredSocialAccountAdapter(DefaultSocialAccountAdapter):
             )
             return redirect('account_login')
 
-        # Check if existing user is active
-        try:
-            user = User.objects.get(email=email)
-
-            if not user.is_active:
-                messages.error(
-                    request,
-                    f"Your account ({email}) has been deactivated. "
-                    f"Please contact your administrator."
-                )
-                sociallogin.disconnect(request)
-                return redirect('account_login')
-
-        except User.DoesNotExist:
-            # New user - will be created with MEMBER role
-            pass
+        # Check if existing user is active (new users will be created with MEMBER role)
+        user = self._get_existing_user(sociallogin)
+        if user is not None and not user.is_active:
+            messages.error(
+                request,
+                f"Your account ({email}) has been deactivated. "
+                f"Please contact your administrator."
+            )
+            sociallogin.disconnect(request)
+            return redirect('account_login')
 
     def populate_user(self, request, sociallogin, data):
         """
@@ -95,16 +111,16 @@ class PreRegisteredSocialAccountAdapter(DefaultSocialAccountAdapter):
         user = super().populate_user(request, sociallogin, data)
 
         # Get existing user from database
-        email = sociallogin.email_addresses[0].email if sociallogin.email_addresses else None
+        email = self._get_email(sociallogin)
         if email:
-            try:
-                existing_user = User.objects.get(email=email)
+            existing_user = self._get_existing_user(sociallogin)
+            if existing_user is not None:
                 # Update user info from OAuth (name, etc.)
                 user.first_name = data.get('first_name', existing_user.first_name)
                 user.last_name = data.get('last_name', existing_user.last_name)
                 user.role = existing_user.role  # Preserve existing role
                 user.is_pre_registered = True
-            except User.DoesNotExist:
+            else:
                 # New OAuth user - set MEMBER role by default
                 user.role = 'MEMBER'
                 user.is_pre_registered = True
@@ -116,13 +132,13 @@ class PreRegisteredSocialAccountAdapter(DefaultSocialAccountAdapter):
         Save the social account user.
         Updates existing users or creates new ones with MEMBER role.
         """
-        email = sociallogin.email_addresses[0].email if sociallogin.email_addresses else None
+        email = self._get_email(sociallogin)
 
         if email:
-            try:
-                # Get existing user
-                user = User.objects.get(email=email)
+            # Get existing user
+            user = self._get_existing_user(sociallogin)
 
+            if user is not None:
                 # Update user info from OAuth
                 if sociallogin.account.extra_data:
                     user.first_name = sociallogin.account.extra_data.get(
@@ -137,13 +153,12 @@ class PreRegisteredSocialAccountAdapter(DefaultSocialAccountAdapter):
                 user.save()
                 return user
 
-            except User.DoesNotExist:
-                # Create new OAuth user with MEMBER role
-                user = super().save_user(request, sociallogin, form)
-                user.role = 'MEMBER'
-                user.is_pre_registered = True
-                user.save()
-                return user
+            # Create new OAuth user with MEMBER role
+            user = super().save_user(request, sociallogin, form)
+            user.role = 'MEMBER'
+            user.is_pre_registered = True
+            user.save()
+            return user
 
         # Fallback to default behavior
         return super().save_user(request, sociallogin, form)
@@ -37,6 +37,10 @@ class UserAdmin(BaseUserAdmin):
 
     readonly_fields = ['created_at', 'updated_at', 'last_login']
 
+    def get_queryset(self, request):
+        """Count held items in the changelist query instead of once per row."""
+        return super().get_queryset(request).with_held_item_counts()
+
     def full_name(self, obj):
         """Display full name."""
         return obj.get_full_name()
@@ -44,8 +48,9 @@ class UserAdmin(BaseUserAdmin):
 
     def item_count(self, obj):
         """Display count of items held by user."""
-        count = obj.get_item_count()
+        count = obj.item_count
         if count > 0:
             return format_html('<span style="color: orange; font-weight: bold;">{}</span>', count)
         return count
     item_count.short_description = 'Items Held'
+    item_count.admin_order_field = 'item_count'
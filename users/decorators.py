@@ -8,6 +8,8 @@ from django.core.exceptions import PermissionDenied
 from django.shortcuts import redirect
 from django.contrib import messages
 
+from items.models import Item
+
 
 def role_required(allowed_roles):
     """
@@ -21,17 +23,18 @@ def role_required(allowed_roles):
     Args:
         allowed_roles: List of role strings (e.g., ['MEMBER', 'STAFF', 'MANAGER'])
     """
+    # Fixed per decorated view, so built once here rather than per request
+    allowed = frozenset(allowed_roles)
+    denied_message = f"Access denied. This page requires {' or '.join(allowed_roles)} role."
+
     def decorator(view_func):
         @wraps(view_func)
         @login_required
         def wrapper(request, *args, **kwargs):
-            if request.user.role in allowed_roles:
+            if request.user.role in allowed:
                 return view_func(request, *args, **kwargs)
             else:
-                messages.error(
-                    request,
-                    f"Access denied. This page requires {' or '.join(allowed_roles)} role."
-                )
+                messages.error(request, denied_message)
                 raise PermissionDenied
         return wrapper
     return decorator
@@ -75,19 +78,23 @@ def owns_item_or_staff(view_func):
     @wraps(view_func)
     @login_required
     def wrapper(request, *args, **kwargs):
-        from items.models import Item
-
         item_id = kwargs.get('pk') or kwargs.get('item_id')
         if not item_id:
             raise PermissionDenied("No item ID provided")
 
-        try:
-            item = Item.objects.get(pk=item_id)
-        except Item.DoesNotExist:
+        # Staff/Admin may access any item; the view loads (or 404s) it
+        if request.user.can_manage_items():
+            return view_func(request, *args, **kwargs)
+
+        # Otherwise only the owner column is needed to decide
+        owner_ids = list(
+            Item.objects.filter(pk=item_id).values_list('current_owner_id', flat=True)
+        )
+        if not owner_ids:
             raise PermissionDenied("Item not found")
 
-        # Allow if user owns the item or is Staff/Admin
-        if item.current_owner == request.user or request.user.can_manage_items():
+        # Allow if user owns the item
+        if owner_ids[0] == request.user.pk:
             return view_func(request, *args, **kwargs)
         else:
             messages.error(
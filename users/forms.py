@@ -6,8 +6,39 @@ import secrets
 import string
 from django import forms
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
 from .models import User
 
+# Shared OS-entropy source and character sets for generated passwords
+_SYSRAND = secrets.SystemRandom()
+_PASSWORD_SPECIALS = "!@#$%&*"
+_PASSWORD_ALPHABET = string.ascii_uppercase + string.ascii_lowercase + string.digits + _PASSWORD_SPECIALS
+
+# The only role staff may assign when pre-registering
+_STAFF_ROLE_CHOICES = (('MEMBER', 'Member'),)
+
+
+def _generate_password(length=12):
+    """
+    Generate a secure random password.
+    Returns password with: uppercase, lowercase, digits, and special characters.
+    """
+    # Ensure at least one character from each category
+    password = [
+        _SYSRAND.choice(string.ascii_uppercase),
+        _SYSRAND.choice(string.ascii_lowercase),
+        _SYSRAND.choice(string.digits),
+        _SYSRAND.choice(_PASSWORD_SPECIALS),
+    ]
+
+    # Fill the rest randomly in one call
+    password += _SYSRAND.choices(_PASSWORD_ALPHABET, k=length - 4)
+
+    # Shuffle to avoid predictable patterns
+    _SYSRAND.shuffle(password)
+
+    return ''.join(password)
+
 
 class UserPreRegisterForm(forms.ModelForm):
     """Form for pre-registering a new user."""
@@ -46,40 +77,32 @@ class UserPreRegisterForm(forms.ModelForm):
         super().__init__(*args, **kwargs)
 
         # Staff can only add Members
-        if self.request_user and self.request_user.role == 'STAFF':
-            self.fields['role'].choices = [('MEMBER', 'Member')]
+        if getattr(self.request_user, 'role', None) == 'STAFF':
+            self.fields['role'].choices = _STAFF_ROLE_CHOICES
 
     def clean_email(self):
-        """Validate email is not already registered."""
+        """Validate email is not already registered (case-insensitively)."""
         email = self.cleaned_data.get('email')
-        if User.objects.filter(email=email).exists():
+        if User.objects.filter(email__iexact=email).exists():
             raise ValidationError(f"User with email {email} already exists.")
         return email
 
-    @staticmethod
-    def generate_password(length=12):
+    def validate_unique(self):
         """
-        Generate a secure random password.
-        Returns password with: uppercase, lowercase, digits, and special characters.
-        """
-        alphabet = string.ascii_uppercase + string.ascii_lowercase + string.digits + "!@#$%&*"
-
-        # Ensure at least one character from each category
-        password = [
-            secrets.choice(string.ascii_uppercase),
-            secrets.choice(string.ascii_lowercase),
-            secrets.choice(string.digits),
-            secrets.choice("!@#$%&*")
-        ]
+        Skip the model's exact-match email check.
 
-        # Fill the rest randomly
-        for _ in range(length - 4):
-            password.append(secrets.choice(alphabet))
-
-        # Shuffle to avoid predictable patterns
-        secrets.SystemRandom().shuffle(password)
+        clean_email() already covers it (and case variants), so running
+        both would query the same row twice.
+        """
+        exclude = self._get_validation_exclusions()
+        exclude.add('email')
+        try:
+            self.instance.validate_unique(exclude=exclude)
+        except ValidationError as e:
+            self._update_errors(e)
 
-        return ''.join(password)
+    # Kept for callers that used the form as the entry point
+    generate_password = staticmethod(_generate_password)
 
     def save(self, commit=True):
         """
@@ -90,11 +113,17 @@ class UserPreRegisterForm(forms.ModelForm):
         user.is_pre_registered = True
 
         # Generate secure password
-        password = self.generate_password()
+        password = _generate_password()
         user.set_password(password)
 
         if commit:
-            user.save()
+            # The unique index is the final word if the same email was
+            # registered between clean_email() and this INSERT
+            try:
+                with transaction.atomic():
+                    user.save()
+            except IntegrityError:
+                raise ValidationError(f"User with email {user.email} already exists.")
 
         return user, password  # Return both user and password for display
 
@@ -146,18 +175,19 @@ class UserEditForm(forms.ModelForm):
         self.request_user = kwargs.pop('request_user', None)
         super().__init__(*args, **kwargs)
 
+        request_role = getattr(self.request_user, 'role', None)
+
         # Only managers can edit roles and auditor permission
-        if self.request_user and self.request_user.role != 'MANAGER':
+        if request_role and request_role != 'MANAGER':
             self.fields['role'].disabled = True
             self.fields['role'].help_text = 'Only managers can change user roles'
             self.fields['is_auditor'].disabled = True
             self.fields['is_auditor'].help_text = 'Only managers can grant auditor permission'
 
         # Staff can't edit manager accounts
-        if self.request_user and self.request_user.role == 'STAFF':
-            if self.instance.role == 'MANAGER':
-                for field in self.fields:
-                    self.fields[field].disabled = True
+        if request_role == 'STAFF' and self.instance.role == 'MANAGER':
+            for field in self.fields.values():
+                field.disabled = True
 
     def save(self, commit=True):
         """
@@ -169,7 +199,7 @@ class UserEditForm(forms.ModelForm):
 
         # Generate new password if requested
         if self.cleaned_data.get('reset_password'):
-            generated_password = UserPreRegisterForm.generate_password()
+            generated_password = _generate_password()
             user.set_password(generated_password)
 
         if commit:
@@ -182,7 +212,7 @@ class ForcedTransferForm(forms.Form):
     """Form for forced transfer of all items from one user to another."""
 
     target_staff = forms.ModelChoiceField(
-        queryset=User.objects.filter(role__in=['STAFF', 'MANAGER'], is_active=True),
+        queryset=User.objects.none(),  # Set in __init__
         label='Transfer all items to:',
         help_text='Select a Staff or Manager user to receive all items.',
         widget=forms.Select(attrs={
@@ -197,3 +227,11 @@ class ForcedTransferForm(forms.Form):
             'class': 'w-4 h-4 text-orange-600 border-gray-300 rounded focus:ring-orange-500'
         })
     )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Only the columns __str__ needs; filtered on the active-role partial index
+        self.fields['target_staff'].queryset = User.objects.filter(
+            is_active=True, role__in=(User.Role.STAFF, User.Role.MANAGER)
+        ).only('pk', 'first_name', 'last_name', 'email', 'role').order_by('first_name', 'last_name')
@@ -3,20 +3,39 @@
 from django.db import migrations, models
 
 
+# Rows per UPDATE; each chunk commits on its own (the migration is non-atomic)
+CHUNK_SIZE = 5000
+
+
+def _rename_role(User, old_role, new_role):
+    """Move users from old_role to new_role in short pk-batched UPDATEs."""
+    while True:
+        ids = list(
+            User.objects.filter(role=old_role).order_by('pk').values_list('pk', flat=True)[:CHUNK_SIZE]
+        )
+        if not ids:
+            break
+        User.objects.filter(pk__in=ids).update(role=new_role)
+
+
 def rename_teacher_to_member(apps, schema_editor):
     """Rename all users with TEACHER role to MEMBER role."""
     User = apps.get_model('users', 'User')
-    User.objects.filter(role='TEACHER').update(role='MEMBER')
+    _rename_role(User, 'TEACHER', 'MEMBER')
 
 
 def rename_member_to_teacher(apps, schema_editor):
     """Reverse migration: Rename MEMBER back to TEACHER."""
     User = apps.get_model('users', 'User')
-    User.objects.filter(role='MEMBER').update(role='TEACHER')
+    _rename_role(User, 'MEMBER', 'TEACHER')
 
 
 class Migration(migrations.Migration):
 
+    # Let each UPDATE chunk commit independently instead of holding one
+    # long transaction over the whole user table
+    atomic = False
+
     dependencies = [
         ('users', '0005_user_disable_expiration_emails'),
     ]
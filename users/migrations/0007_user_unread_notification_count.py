@@ -0,0 +1,42 @@
+# Generated by Django 5.0.14 on 2026-10-15 22:35
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_unread_notification_count(apps, schema_editor):
+    """Populate the denormalized unread count from existing notifications."""
+    User = apps.get_model('users', 'User')
+    Notification = apps.get_model('notifications', 'Notification')
+
+    unread = Notification.objects.filter(
+        recipient=OuterRef('pk'),
+        is_read=False
+    ).order_by().values('recipient').annotate(c=Count('pk')).values('c')
+
+    User.objects.update(
+        unread_notification_count=Coalesce(
+            Subquery(unread, output_field=IntegerField()), Value(0)
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_rename_teacher_to_member'),
+        ('notifications', '0002_notification_updated_at_alter_notification_recipient_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='unread_notification_count',
+            field=models.PositiveIntegerField(default=0, help_text='Denormalized count of unread notifications (maintained by Notification)', verbose_name='Unread Notifications'),
+        ),
+        migrations.RunPython(
+            backfill_unread_notification_count,
+            reverse_code=migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.14 on 2026-10-15 23:24
+
+import django.core.validators
+import re
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0008_user_email_upper_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='phone_number',
+            field=models.CharField(blank=True, max_length=20, null=True, validators=[django.core.validators.RegexValidator(flags=re.RegexFlag['ASCII'], message="Phone number must be entered in the format: '+999999999'. Up to 15 digits allowed.", regex='^\\+?1?[0-9]{9,15}\\Z')], verbose_name='Phone Number'),
+        ),
+    ]
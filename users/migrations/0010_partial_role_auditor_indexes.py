@@ -0,0 +1,38 @@
+# Generated by Django 5.0.14 on 2026-10-15 23:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0009_alter_user_phone_number_ascii'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='user',
+            name='users_user_email_6f2530_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='user',
+            name='users_user_is_acti_ddda02_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='user',
+            name='users_user_is_audi_2d0b02_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='user',
+            name='users_user_role_e1ec1a_idx',
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['role'], name='users_active_role_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('is_auditor', True)), fields=['is_auditor'], name='users_auditors_idx'),
+        ),
+    ]
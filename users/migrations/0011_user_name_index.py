@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-15 23:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0010_partial_role_auditor_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['first_name', 'last_name'], name='users_name_idx'),
+        ),
+    ]
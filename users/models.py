@@ -1,10 +1,28 @@
 from django.contrib.auth.models import AbstractUser, BaseUserManager
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Upper
 from django.core.exceptions import ValidationError
+from django.utils import timezone
+from django.utils.functional import cached_property
 from .validators import phone_validator
 
 
-class UserManager(BaseUserManager):
+class UserQuerySet(models.QuerySet):
+    """QuerySet helpers for users."""
+
+    def with_held_item_counts(self):
+        """
+        Annotate item_count: items each user currently holds.
+
+        One aggregate query for a whole list; prefer this over calling
+        get_item_count()/has_items() per user.
+        """
+        return self.annotate(item_count=models.Count(
+            'current_items', filter=models.Q(current_items__status__in=User._HELD_STATUSES)
+        ))
+
+
+class UserManager(BaseUserManager.from_queryset(UserQuerySet)):
     """Custom user manager for email-based authentication."""
 
     def create_user(self, email, password=None, **extra_fields):
@@ -36,6 +54,16 @@ class User(AbstractUser):
         STAFF = 'STAFF', 'Staff'
         MANAGER = 'MANAGER', 'Manager'
 
+    # Precomputed label lookup for __str__, which admin lists and user
+    # pickers call once per row
+    _ROLE_LABELS = dict(Role.choices)
+
+    # Roles with staff privileges, built once for membership checks
+    _STAFF_ROLES = frozenset((Role.STAFF.value, Role.MANAGER.value))
+
+    # Item statuses that count as "held" (anything still in circulation)
+    _HELD_STATUSES = ('NORMAL', 'DAMAGED', 'PENDING_INSPECTION')
+
     # Remove username, use email instead
     username = None
     email = models.EmailField(unique=True, verbose_name='Email Address')
@@ -74,6 +102,11 @@ class User(AbstractUser):
         verbose_name='Disable Expiration Warning Emails',
         help_text='Opt out of email notifications for expiring requests (web notifications will still be sent)'
     )
+    unread_notification_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Unread Notifications',
+        help_text='Denormalized count of unread notifications (maintained by Notification)'
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -87,20 +120,46 @@ class User(AbstractUser):
         verbose_name_plural = 'Users'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['email']),
+            # Exact email lookups use the unique constraint's index.
+            # Case-insensitive lookups: iexact compiles to UPPER(email) on PostgreSQL
+            models.Index(Upper('email'), name='users_user_email_upper_idx'),
             models.Index(fields=['role']),
-            models.Index(fields=['is_active']),
-            models.Index(fields=['is_auditor']),
-            models.Index(fields=['role', 'is_active']),  # Composite index for common queries
+            # Partial indexes: role pickers/counts only ever look at active
+            # users, and only auditors (a small minority) are filtered on
+            models.Index(
+                fields=['role'], condition=models.Q(is_active=True), name='users_active_role_idx'
+            ),
+            models.Index(
+                fields=['is_auditor'], condition=models.Q(is_auditor=True), name='users_auditors_idx'
+            ),
+            # Name-ordered user pickers (e.g. forced transfer targets)
+            models.Index(fields=['first_name', 'last_name'], name='users_name_idx'),
         ]
 
     def __str__(self):
-        return f"{self.get_full_name() or self.email} ({self.get_role_display()})"
+        return f"{self.get_full_name()} ({self._ROLE_LABELS.get(self.role, self.role)})"
+
+    def save(self, *args, **kwargs):
+        """
+        Save the user without writing back unread_notification_count.
+
+        The counter is only changed by F() updates from notifications; a
+        full-row save of an existing user would otherwise overwrite any
+        change made since this instance was loaded.
+        """
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'unread_notification_count'
+            ]
+        super().save(*args, **kwargs)
 
     def get_full_name(self):
         """Return the first_name plus the last_name, with a space in between."""
-        full_name = f"{self.first_name} {self.last_name}".strip()
-        return full_name or self.email
+        first_name, last_name = self.first_name, self.last_name
+        if first_name and last_name:
+            return f"{first_name} {last_name}"
+        return first_name or last_name or self.email
 
     def get_short_name(self):
         """Return the short name for the user."""
@@ -126,23 +185,28 @@ class User(AbstractUser):
         """Alias for is_manager (backwards compatibility)."""
         return self.is_manager
 
-    @property
+    @cached_property
     def is_staff_or_admin(self):
-        """Check if user is staff or manager."""
-        return self.role in [self.Role.STAFF, self.Role.MANAGER]
+        """
+        Check if user is staff or manager.
+
+        Cached on the instance: request.user is checked by views and by
+        several template blocks on every page.
+        """
+        return self.role in self._STAFF_ROLES
 
     @property
     def is_staff_or_manager(self):
         """Check if user is staff or manager."""
-        return self.role in [self.Role.STAFF, self.Role.MANAGER]
+        return self.role in self._STAFF_ROLES
 
     def can_manage_users(self):
         """Check if user can manage other users."""
-        return self.role in [self.Role.STAFF, self.Role.MANAGER]
+        return self.role in self._STAFF_ROLES
 
     def can_manage_items(self):
         """Check if user can manage items (CRUD operations)."""
-        return self.role in [self.Role.STAFF, self.Role.MANAGER]
+        return self.role in self._STAFF_ROLES
 
     def can_force_transfer(self):
         """Check if user can force transfer items without approval."""
@@ -162,68 +226,87 @@ class User(AbstractUser):
             bool: True if user can audit this item, False otherwise
         """
         # Staff and managers can audit any item
-        if self.role in [self.Role.STAFF, self.Role.MANAGER]:
+        if self.role in self._STAFF_ROLES:
             return True
 
         # Non-auditors cannot audit
         if not self.is_auditor:
             return False
 
-        # Import here to avoid circular import
-        from audit.models import AuditorAssignment
+        assignments = self._auditor_assignments
 
         # Check for global auditor permission
-        if AuditorAssignment.objects.filter(
-            auditor=self,
-            is_global=True
-        ).exists():
+        if any(is_global for is_global, _, _ in assignments):
             return True
 
         # Check location-based permission
-        if item.current_location and AuditorAssignment.objects.filter(
-            auditor=self,
-            location=item.current_location
-        ).exists():
+        if item.current_location_id and any(
+            location_id == item.current_location_id for _, location_id, _ in assignments
+        ):
             return True
 
         # Check department-based permission
-        if item.current_owner and item.current_owner.department:
-            if AuditorAssignment.objects.filter(
-                auditor=self,
-                department=item.current_owner.department
-            ).exists():
+        if item.current_owner_id and item.current_owner.department:
+            if any(
+                department == item.current_owner.department for _, _, department in assignments
+            ):
                 return True
 
         # No permission found
         return False
 
+    @cached_property
+    def _auditor_assignments(self):
+        """
+        This auditor's assignments as (is_global, location_id, department) rows.
+
+        Loaded in one query and cached on the instance, so repeated
+        can_audit_item() checks (e.g. across a list of items) don't each
+        run their own lookups.
+        """
+        # Import here to avoid circular import
+        from audit.models import AuditorAssignment
+
+        return list(
+            AuditorAssignment.objects.filter(auditor=self).values_list(
+                'is_global', 'location_id', 'department'
+            )
+        )
+
     def has_items(self):
         """Check if user currently holds any items."""
-        return self.current_items.filter(
-            status__in=['NORMAL', 'DAMAGED', 'PENDING_INSPECTION']
-        ).exists()
+        return self.current_items.filter(status__in=self._HELD_STATUSES).exists()
 
     def get_item_count(self):
         """Get count of items currently held by user."""
-        return self.current_items.filter(
-            status__in=['NORMAL', 'DAMAGED', 'PENDING_INSPECTION']
-        ).count()
+        return self.current_items.filter(status__in=self._HELD_STATUSES).count()
 
     def delete(self, *args, **kwargs):
         """Override delete to prevent deletion of users with items."""
-        if self.has_items():
+        # One COUNT serves both the check and the error message
+        item_count = self.get_item_count()
+        if item_count:
             raise ValidationError(
-                f"Cannot delete {self.email}. User still holds {self.get_item_count()} items. "
+                f"Cannot delete {self.email}. User still holds {item_count} items. "
                 f"Transfer all items first or use Forced Transfer."
             )
         super().delete(*args, **kwargs)
 
+    @transaction.atomic
     def deactivate(self):
         """Deactivate user account (set is_active=False)."""
-        if self.has_items():
+        # Lock the user row so concurrent deactivate/forced-transfer calls
+        # for the same user serialize around the held-items check
+        User.objects.select_for_update().filter(pk=self.pk).values_list('pk').first()
+        item_count = self.get_item_count()
+        if item_count:
             raise ValidationError(
-                f"Cannot deactivate {self.email}. User still holds {self.get_item_count()} items. "
+                f"Cannot deactivate {self.email}. User still holds {item_count} items. "
                 f"Transfer all items first or use Forced Transfer."
             )
+        # Narrow UPDATE instead of rewriting the whole row; there are no
+        # save signals on User to skip
+        now = timezone.now()
+        User.objects.filter(pk=self.pk).update(is_active=False, updated_at=now)
         self.is_active = False
-        self.save()
+        self.updated_at = now
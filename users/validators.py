@@ -2,12 +2,16 @@
 Validators for user model fields.
 """
 
+import re
+
 from django.core.validators import RegexValidator
 
 
 # Phone number validator (International E.164 format)
 # Accepts formats like: +999999999999, 0999999999, (999) 999-9999
+# ASCII digits only, and \Z so a trailing newline is not accepted
 phone_validator = RegexValidator(
-    regex=r'^\+?1?\d{9,15}$',
+    regex=r'^\+?1?[0-9]{9,15}\Z',
+    flags=re.ASCII,
     message="Phone number must be entered in the format: '+999999999'. Up to 15 digits allowed."
 )
@@ -5,9 +5,11 @@ User management views.
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from django.core.paginator import Paginator
 from django.core.exceptions import ValidationError
 from django.db import transaction
 from django.db.models import Count, Q
+from django.utils import timezone
 
 from .models import User
 from .forms import UserPreRegisterForm, UserEditForm, ForcedTransferForm
@@ -16,12 +18,15 @@ from items.models import Item
 from transfers.models import TransferLog
 
 
+# Columns the single-flag views (activate, grant/revoke auditor) need for
+# their checks, messages and confirmation pages
+_FLAG_VIEW_FIELDS = ('email', 'first_name', 'last_name', 'role', 'is_active', 'is_auditor')
+
+
 @manager_required
 def user_list(request):
     """List all users (Manager only)."""
-    users = User.objects.all().annotate(
-        item_count=Count('current_items', filter=Q(current_items__status__in=['NORMAL', 'DAMAGED', 'PENDING_INSPECTION']))
-    ).order_by('-created_at')
+    users = User.objects.all()
 
     # Filter by role if specified
     role_filter = request.GET.get('role')
@@ -35,15 +40,32 @@ def user_list(request):
     elif status_filter == 'inactive':
         users = users.filter(is_active=False)
 
-    # Calculate statistics
-    users_list = list(users)  # Convert to list to avoid multiple queries
-    total_users = len(users_list)
-    active_users = sum(1 for user in users_list if user.is_active)
-    manager_count = sum(1 for user in users_list if user.is_manager)
+    # Calculate statistics in one aggregate query (before the per-user
+    # item count annotation, which would otherwise wrap it in a subquery)
+    stats = users.aggregate(
+        total=Count('pk'),
+        active=Count('pk', filter=Q(is_active=True)),
+        managers=Count('pk', filter=Q(role=User.Role.MANAGER)),
+    )
+    total_users = stats['total']
+    active_users = stats['active']
+    manager_count = stats['managers']
     inactive_users = total_users - active_users
 
+    # Paginate so only one page of users is annotated per request; the
+    # filtered total is already known, so the paginator needn't COUNT again
+    paginator = Paginator(
+        users.only(
+            'email', 'first_name', 'last_name', 'role', 'is_active', 'is_auditor', 'created_at'
+        ).with_held_item_counts().order_by('-created_at'),
+        50
+    )
+    paginator.count = total_users
+    page_obj = paginator.get_page(request.GET.get('page'))
+
     context = {
-        'users': users_list,
+        'users': page_obj,
+        'page_obj': page_obj,
         'role_filter': role_filter,
         'status_filter': status_filter,
         'total_users': total_users,
@@ -63,22 +85,27 @@ def user_pre_register(request):
     if request.method == 'POST':
         form = UserPreRegisterForm(request.POST, request_user=request.user)
         if form.is_valid():
-            user, generated_password = form.save()
-            messages.success(
-                request,
-                f"User {user.email} has been created successfully. "
-                f"They can login with Google OAuth OR with the generated password below."
-            )
-            # Store password in session to display once
-            request.session['generated_password'] = generated_password
-            request.session['generated_for_email'] = user.email
-            return redirect('users:user_pre_register')
+            try:
+                user, generated_password = form.save()
+            except ValidationError as e:
+                # Lost a race with a concurrent registration of the same email
+                form.add_error('email', e)
+            else:
+                messages.success(
+                    request,
+                    f"User {user.email} has been created successfully. "
+                    f"They can login with Google OAuth OR with the generated password below."
+                )
+                # Store password in session to display once
+                request.session['generated_password'] = generated_password
+                request.session['generated_for_email'] = user.email
+                return redirect('users:user_pre_register')
     else:
         form = UserPreRegisterForm(request_user=request.user)
 
         # Check if there's a generated password to display
-        if 'generated_password' in request.session:
-            generated_password = request.session.pop('generated_password')
+        generated_password = request.session.pop('generated_password', None)
+        if generated_password:
             generated_for_email = request.session.pop('generated_for_email', '')
             messages.warning(
                 request,
@@ -98,17 +125,17 @@ def user_detail(request, pk):
     """View user details (Manager only)."""
     user = get_object_or_404(User, pk=pk)
 
-    # Get user's items
-    items = Item.objects.filter(current_owner=user)
+    # Get user's items (evaluated once; the count is taken from the list)
+    items = list(Item.objects.filter(current_owner=user))
 
     # Get transfer history (sent and received)
-    transfers_sent = TransferLog.objects.filter(from_user=user).order_by('-transferred_at')[:20]
-    transfers_received = TransferLog.objects.filter(to_user=user).order_by('-transferred_at')[:20]
+    transfers_sent = TransferLog.objects.filter(from_user=user).with_related().order_by('-transferred_at')[:20]
+    transfers_received = TransferLog.objects.filter(to_user=user).with_related().order_by('-transferred_at')[:20]
 
     context = {
         'user_obj': user,  # Use user_obj to avoid conflict with request.user
         'items': items,
-        'items_count': items.count(),
+        'items_count': len(items),
         'transfers_sent': transfers_sent,
         'transfers_received': transfers_received,
     }
@@ -119,7 +146,7 @@ def user_detail(request, pk):
 @manager_required
 def user_edit(request, pk):
     """Edit user details (Manager only)."""
-    user = get_object_or_404(User, pk=pk)
+    user = get_object_or_404(User.objects.with_held_item_counts(), pk=pk)
     generated_password = None
 
     # Prevent editing yourself
@@ -153,8 +180,8 @@ def user_edit(request, pk):
         form = UserEditForm(instance=user, request_user=request.user)
 
         # Check if there's a generated password to display
-        if 'generated_password' in request.session:
-            generated_password = request.session.pop('generated_password')
+        generated_password = request.session.pop('generated_password', None)
+        if generated_password:
             generated_for_email = request.session.pop('generated_for_email', '')
             messages.warning(
                 request,
@@ -173,15 +200,16 @@ def user_edit(request, pk):
 @manager_required
 def user_deactivate(request, pk):
     """Deactivate a user (Manager only)."""
-    user = get_object_or_404(User, pk=pk)
+    # Held-item count comes with the user row
+    user = get_object_or_404(User.objects.with_held_item_counts(), pk=pk)
 
     # Prevent deactivating yourself
     if user == request.user:
         messages.error(request, "You cannot deactivate your own account.")
         return redirect('users:user_edit', pk=pk)
 
-    # Check if user has items
-    item_count = user.get_item_count()
+    # Check if user has items (deactivate() re-checks under a row lock)
+    item_count = user.item_count
 
     if request.method == 'POST':
         if item_count > 0:
@@ -224,9 +252,16 @@ def user_forced_transfer(request, pk):
         current_owner=source_user,
         status__in=['NORMAL', 'DAMAGED', 'PENDING_INSPECTION']
     )
-    item_count_preview = items_preview.count()
+    # A POST only needs to know whether anything is held; the count is
+    # for the confirmation page
+    if request.method == 'POST':
+        item_count_preview = None
+        has_items = items_preview.exists()
+    else:
+        item_count_preview = items_preview.count()
+        has_items = item_count_preview > 0
 
-    if item_count_preview == 0:
+    if not has_items:
         messages.info(request, f"{source_user.email} does not hold any items.")
         return redirect('users:user_edit', pk=pk)
 
@@ -237,28 +272,40 @@ def user_forced_transfer(request, pk):
 
             try:
                 with transaction.atomic():
-                    # Lock items for update to prevent race conditions
-                    items = Item.objects.filter(
+                    # Lock the receiving user so a concurrent deactivate()
+                    # can't pass its held-items check mid-transfer
+                    User.objects.select_for_update().filter(pk=target_staff.pk).values_list('pk').first()
+
+                    # Lock the held items (ids only) to prevent race conditions
+                    held_items = Item.objects.filter(
                         current_owner=source_user,
                         status__in=['NORMAL', 'DAMAGED', 'PENDING_INSPECTION']
-                    ).select_for_update()
-
-                    item_count = items.count()
-
-                    # Transfer all items
-                    for item in items:
-                        old_owner = item.current_owner
-                        item.current_owner = target_staff
-                        item.save()
-
-                        # Create transfer log with is_forced=True
-                        TransferLog.objects.create(
-                            item=item,
-                            from_user=old_owner,
-                            to_user=target_staff,
-                            request=None,  # No request for forced transfers
-                            notes=f"Forced transfer by Admin {request.user.email}",
-                            is_forced=True
+                    )
+                    item_ids = list(held_items.select_for_update().values_list('pk', flat=True))
+
+                    # Reassign them all in one UPDATE. Only held (transferable)
+                    # statuses are selected, so the per-item save()/full_clean()
+                    # checks add nothing here. The UPDATE targets the locked ids
+                    # rather than re-running the filter, so an item that starts
+                    # qualifying after the lock isn't moved without a log.
+                    item_count = Item.objects.filter(pk__in=item_ids).update(
+                        current_owner=target_staff, updated_at=timezone.now()
+                    )
+
+                    # Transfer logs with is_forced=True, created a chunk of
+                    # items at a time so memory stays flat for large holdings
+                    notes = f"Forced transfer by Admin {request.user.email}"
+                    for start in range(0, len(item_ids), 5000):
+                        TransferLog.bulk_log(
+                            {
+                                'item_id': item_id,
+                                'from_user_id': source_user.pk,
+                                'to_user': target_staff,
+                                'request': None,  # No request for forced transfers
+                                'notes': notes,
+                                'is_forced': True,
+                            }
+                            for item_id in item_ids[start:start + 5000]
                         )
 
                     messages.success(
@@ -274,6 +321,10 @@ def user_forced_transfer(request, pk):
     else:
         form = ForcedTransferForm()
 
+    # Re-rendering an invalid POST still needs the count
+    if item_count_preview is None:
+        item_count_preview = items_preview.count()
+
     context = {
         'source_user': source_user,
         'items': items_preview,
@@ -287,11 +338,11 @@ def user_forced_transfer(request, pk):
 @manager_required
 def user_activate(request, pk):
     """Reactivate a deactivated user (Manager only)."""
-    user = get_object_or_404(User, pk=pk)
+    user = get_object_or_404(User.objects.only(*_FLAG_VIEW_FIELDS), pk=pk)
 
     if request.method == 'POST':
-        user.is_active = True
-        user.save()
+        # Flip just the flag (no full-row save)
+        User.objects.filter(pk=pk, is_active=False).update(is_active=True, updated_at=timezone.now())
         messages.success(
             request,
             f"User {user.email} has been reactivated successfully."
@@ -308,7 +359,7 @@ def user_activate(request, pk):
 @manager_required
 def grant_auditor_permission(request, pk):
     """Grant auditor permission to a user (Manager only)."""
-    user = get_object_or_404(User, pk=pk)
+    user = get_object_or_404(User.objects.only(*_FLAG_VIEW_FIELDS), pk=pk)
 
     # Prevent granting to yourself (optional - managers might want to make themselves auditors)
     # if user == request.user:
@@ -320,8 +371,13 @@ def grant_auditor_permission(request, pk):
         return redirect('users:user_edit', pk=pk)
 
     if request.method == 'POST':
-        user.is_auditor = True
-        user.save()
+        # Conditional flag UPDATE; a concurrent grant makes this a no-op
+        updated = User.objects.filter(pk=pk, is_auditor=False).update(
+            is_auditor=True, updated_at=timezone.now()
+        )
+        if not updated:
+            messages.info(request, f"{user.email} already has auditor permission.")
+            return redirect('users:user_edit', pk=pk)
         messages.success(
             request,
             f"Auditor permission granted to {user.email}. They can now access the audit checklist."
@@ -338,15 +394,20 @@ def grant_auditor_permission(request, pk):
 @manager_required
 def revoke_auditor_permission(request, pk):
     """Revoke auditor permission from a user (Manager only)."""
-    user = get_object_or_404(User, pk=pk)
+    user = get_object_or_404(User.objects.only(*_FLAG_VIEW_FIELDS), pk=pk)
 
     if not user.is_auditor:
         messages.info(request, f"{user.email} does not have auditor permission.")
         return redirect('users:user_edit', pk=pk)
 
     if request.method == 'POST':
-        user.is_auditor = False
-        user.save()
+        # Conditional flag UPDATE; a concurrent revoke makes this a no-op
+        updated = User.objects.filter(pk=pk, is_auditor=True).update(
+            is_auditor=False, updated_at=timezone.now()
+        )
+        if not updated:
+            messages.info(request, f"{user.email} does not have auditor permission.")
+            return redirect('users:user_edit', pk=pk)
         messages.success(
             request,
             f"Auditor permission revoked from {user.email}."